@@ -1,42 +1,387 @@
-from typing import Dict, List, Set, Optional, Tuple  # Import necessary types for type hinting
+from typing import Dict, Iterator, List, Set, Optional, Tuple  # Import necessary types for type hinting
+from collections import deque  # Import deque for an efficient BFS queue
+import heapq  # Import heapq for the pure-Python Dijkstra and A* kernels
+from itertools import islice  # Import islice to cap streamed path enumeration
+from functools import lru_cache  # Import lru_cache to memoize repeated route queries
+import math  # Import math for scalar distance helpers
+import numpy as np  # Import NumPy for the CSR adjacency arrays
 from data.campus_data import CampusData  # Import CampusData class to manage campus locations and paths
 import networkx as nx  # Import NetworkX for graph representation
+import logging  # Import logging for debug output
+
+try:
+    from numba import njit  # Optional JIT compiler for the shortest-path kernel
+    _HAVE_NUMBA = True  # Route Dijkstra queries through the compiled kernel
+except ImportError:
+    _HAVE_NUMBA = False  # Keep using the pure-Python heapq kernel
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as plain Python."""
+        return lambda func: func
+
+logger = logging.getLogger(__name__)  # Module-level logger
+
+
+def _dijkstra_rows(rows: List[Tuple[Tuple[int, float], ...]], src: int, dst: int) -> Tuple[List[float], List[int]]:
+    """
+    Single-pair Dijkstra over plain Python adjacency rows, used when numba is unavailable.
+
+    Args:
+        rows: (neighbor index, weight) pairs per node, already restricted to the edges to search
+        src: Index of the start node
+        dst: Index of the target node (search stops once it is settled); -1 settles every reachable node
+
+    Returns:
+        Tuple of (dist, prev) lists indexed by node; prev is -1 where unset
+    """
+    dist = [math.inf] * len(rows)  # Tentative distances
+    prev = [-1] * len(rows)  # Predecessor of each node on its shortest path
+    dist[src] = 0.0  # Distance to the start node is zero
+    heap = [(0.0, src)]  # (distance, node) entries; superseded entries are skipped when popped
+    heappush, heappop = heapq.heappush, heapq.heappop  # Local bindings for the loop
+    while heap:
+        d, u = heappop(heap)  # Pop the closest queued node
+        if d > dist[u]:  # Stale entry for a node already settled closer
+            continue
+        if u == dst:  # Stop as soon as the target is settled
+            break
+        for v, w in rows[u]:  # Iterate through the node's row
+            nd = d + w  # Candidate distance through u
+            if nd < dist[v]:  # Relax the edge if it improves the distance
+                dist[v] = nd  # Update distance
+                prev[v] = u  # Update predecessor
+                heappush(heap, (nd, v))  # Queue the improved distance
+    return dist, prev  # Return distance and predecessor lists
+
+
+@njit(cache=True, nogil=True)
+def _heap_sift_up(heap: np.ndarray, pos: np.ndarray, key: np.ndarray, i: int) -> None:
+    """Move heap[i] up until its parent orders before it by (key, node)."""
+    node = heap[i]  # Node being moved
+    while i > 0:
+        parent = (i - 1) >> 1  # Parent slot
+        p = heap[parent]
+        if key[node] < key[p] or (key[node] == key[p] and node < p):  # Node must rise above its parent
+            heap[i] = p  # Pull the parent down
+            pos[p] = i
+            i = parent
+        else:  # Heap order holds
+            break
+    heap[i] = node  # Place the node
+    pos[node] = i
+
+
+@njit(cache=True, nogil=True)
+def _heap_sift_down(heap: np.ndarray, pos: np.ndarray, key: np.ndarray, size: int, i: int) -> None:
+    """Move heap[i] down until both children order after it by (key, node)."""
+    node = heap[i]  # Node being moved
+    while True:
+        child = 2 * i + 1  # Left child slot
+        if child >= size:  # No children left
+            break
+        c = heap[child]
+        if child + 1 < size:  # Pick the smaller child
+            r = heap[child + 1]
+            if key[r] < key[c] or (key[r] == key[c] and r < c):
+                child += 1
+                c = r
+        if key[c] < key[node] or (key[c] == key[node] and c < node):  # Child must rise above the node
+            heap[i] = c  # Pull the child up
+            pos[c] = i
+            i = child
+        else:  # Heap order holds
+            break
+    heap[i] = node  # Place the node
+    pos[node] = i
+
+
+@njit(cache=True, nogil=True)
+def _dijkstra_csr_compiled(indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray,
+                           edge_mask: np.ndarray, src: int, dst: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Array-only twin of _dijkstra_rows for numba; same (key, node) pop order, so the same routes.
+
+    Args:
+        indptr: Row pointers; neighbors of node i live in indices[indptr[i]:indptr[i+1]]
+        indices: Neighbor node indices
+        weights: Edge weights aligned with indices
+        edge_mask: Boolean array aligned with indices; False entries are skipped
+        src: Index of the start node
+        dst: Index of the target node (search stops once it is settled); -1 settles every reachable node
+
+    Returns:
+        Tuple of (dist, prev) arrays indexed by node; prev is -1 where unset
+    """
+    n = len(indptr) - 1  # Number of nodes
+    dist = np.full(n, np.inf)  # Tentative distances, also the heap keys
+    prev = np.full(n, -1, dtype=np.int32)  # Predecessor of each node on its shortest path
+    heap = np.empty(n, dtype=np.int64)  # Heap-ordered node indices
+    pos = np.full(n, -1, dtype=np.int64)  # Position of each node in the heap, -1 if absent
+    dist[src] = 0.0  # Distance to the start node is zero
+    heap[0] = src  # Seed with the start node
+    pos[src] = 0
+    size = 1  # Number of queued nodes
+    while size > 0:
+        u = heap[0]  # Pop the closest unsettled node
+        pos[u] = -1
+        size -= 1
+        if size > 0:  # Move the bottom entry to the root and sift it down
+            last = heap[size]
+            heap[0] = last
+            pos[last] = 0
+            _heap_sift_down(heap, pos, dist, size, 0)
+        if u == dst:  # Stop as soon as the target is settled
+            break
+        d = dist[u]  # Settled distance of u
+        for k in range(indptr[u], indptr[u + 1]):  # Iterate through the node's CSR row
+            if not edge_mask[k]:  # Skip masked-out edges
+                continue
+            v = indices[k]  # Neighbor index
+            nd = d + weights[k]  # Candidate distance through u
+            if nd < dist[v]:  # Relax the edge if it improves the distance
+                dist[v] = nd  # Update distance
+                prev[v] = u  # Update predecessor
+                p = pos[v]  # Insert or decrease-key
+                if p == -1:
+                    p = size
+                    heap[p] = v
+                    pos[v] = p
+                    size += 1
+                _heap_sift_up(heap, pos, dist, p)
+    return dist, prev  # Return distance and predecessor arrays
+
+
+@njit(cache=True, nogil=True)
+def _landmark_dfs_compiled(indptr: np.ndarray, indices: np.ndarray, edge_mask: np.ndarray, landmark: np.ndarray,
+                           src: int, dst: int, max_count: int, max_depth: int, max_paths: int) -> np.ndarray:
+    """
+    Depth-first walk over every simple src -> dst path, keeping the one with the most landmarks.
+
+    Visits paths in the same order as GraphManager.dfs_all_paths and keeps the first maximum,
+    so it picks the same path as max(all_paths, key=count_landmarks) without storing them all.
+
+    Args:
+        indptr: Row pointers; neighbors of node i live in indices[indptr[i]:indptr[i+1]]
+        indices: Neighbor node indices
+        edge_mask: Boolean array aligned with indices; False entries are skipped
+        landmark: 1 for landmark nodes, 0 for waypoints
+        src: Index of the start node
+        dst: Index of the target node (must differ from src)
+        max_count: Upper bound on any path's landmark count; the search stops once a path reaches it
+        max_depth: Longest path considered, in hops; -1 for no limit
+        max_paths: Stop after this many paths reach dst; -1 for no limit
+
+    Returns:
+        Node indices of the chosen path, or an empty array if dst is unreachable
+    """
+    n = len(indptr) - 1  # Number of nodes
+    found = 0  # Paths that reached dst
+    visited = np.zeros(n, dtype=np.bool_)  # Flags for nodes on the current path
+    path = np.empty(n, dtype=np.int64)  # Current path; one slot per depth
+    cursor = np.empty(n, dtype=np.int64)  # Next CSR slot to try at each depth
+    best = np.empty(0, dtype=np.int64)  # Best path found so far
+    best_count = -1  # Its landmark count
+    depth = 0  # Index of the path's last node
+    path[0] = src  # Start at the source
+    cursor[0] = indptr[src]
+    visited[src] = True
+    count = landmark[src]  # Landmarks on the current path
+    while depth >= 0:
+        u = path[depth]  # Node whose neighbors are being tried
+        k = cursor[depth]  # Next slot in its CSR row
+        if k == indptr[u + 1]:  # Row exhausted: backtrack
+            visited[u] = False
+            count -= landmark[u]
+            depth -= 1
+            continue
+        cursor[depth] = k + 1  # Advance past this slot
+        if not edge_mask[k]:  # Skip masked-out edges
+            continue
+        v = indices[k]  # Neighbor index
+        if visited[v]:  # Skip nodes already on the path
+            continue
+        if v == dst:  # Target reached: keep the path if it beats the best so far
+            if count + landmark[v] > best_count:
+                best_count = count + landmark[v]
+                best = np.empty(depth + 2, dtype=np.int64)
+                best[:depth + 1] = path[:depth + 1]
+                best[depth + 1] = v
+                if best_count >= max_count:  # No remaining path can beat it
+                    break
+            found += 1
+            if found == max_paths:  # Candidate budget spent
+                break
+            continue
+        if max_depth >= 0 and depth + 1 >= max_depth:  # Going deeper cannot reach dst within max_depth hops
+            continue
+        depth += 1  # Descend into the neighbor
+        path[depth] = v
+        cursor[depth] = indptr[v]
+        visited[v] = True
+        count += landmark[v]
+    return best  # Chosen path, empty if none
+
+
+def _astar_rows(rows: List[Tuple[Tuple[int, float], ...]], coords: np.ndarray,
+                scale: float, src: int, dst: int) -> Tuple[List[float], List[int]]:
+    """
+    Single-pair A* over plain Python adjacency rows with a straight-line heuristic.
+
+    Args:
+        rows: (neighbor index, weight) pairs per node, already restricted to the edges to search
+        coords: (N, 2) array of node coordinates
+        scale: Factor converting coordinate distance to a lower bound on path weight
+        src: Index of the start node
+        dst: Index of the target node
+
+    Returns:
+        Tuple of (dist, prev) lists indexed by node; prev is -1 where unset
+    """
+    h = (scale * np.hypot(coords[:, 0] - coords[dst, 0], coords[:, 1] - coords[dst, 1])).tolist()  # Heuristic for every node
+    dist = [math.inf] * len(rows)  # Best known distance from the start
+    prev = [-1] * len(rows)  # Predecessor of each node on its best path
+    dist[src] = 0.0  # Distance to the start node is zero
+    heap = [(h[src], src)]  # (estimate, node) entries; superseded entries are skipped when popped
+    heappush, heappop = heapq.heappush, heapq.heappop  # Local bindings for the loop
+    while heap:
+        f, u = heappop(heap)  # Pop the most promising queued node
+        d = dist[u]  # Distance to the popped node
+        if f > d + h[u]:  # Stale entry from before a shorter distance was found
+            continue
+        if u == dst:  # Stop as soon as the target is settled
+            break
+        for v, w in rows[u]:  # Iterate through the node's row
+            nd = d + w  # Candidate distance through u
+            if nd < dist[v]:  # Relax the edge if it improves the distance
+                dist[v] = nd  # Update distance
+                prev[v] = u  # Update predecessor
+                heappush(heap, (nd + h[v], v))  # Queue with the heuristic estimate
+    return dist, prev  # Return distance and predecessor lists
+
 
 class GraphManager:
     def __init__(self, campus_data: CampusData):
         """Initialize the GraphManager with campus data."""
-        print("\nInitializing GraphManager:")  # Debug message for initialization
         self.campus_data = campus_data  # Store campus data
-        print(f"Campus data contains {len(self.campus_data.locations)} locations and {len(self.campus_data.paths)} paths")  # Print number of locations and paths
+        # Optional cutoffs for the landmark (DFS) route search on very large maps; None keeps the search exact.
+        # Results are memoized, so set these before the first landmark query
+        self.landmark_max_depth: Optional[int] = None  # Longest route considered, in hops
+        self.landmark_max_paths: Optional[int] = None  # Candidate routes examined before settling for the best so far
+        logger.debug("Initializing GraphManager with %d locations and %d paths",
+                     len(self.campus_data.locations), len(self.campus_data.paths))  # Log number of locations and paths
         self.G = self._create_networkx_graph()  # Create the graph from campus data
+        self.G_accessible = self._create_accessible_subgraph()  # Cache the accessible-only subgraph
+        self._build_adjacency()  # Precompute adjacency lists from campus paths
+        self._build_csr()  # Precompute CSR arrays for Dijkstra
+        self._init_query_caches()  # Set up memoization for single-pair queries
         self._verify_graph()  # Verify the created graph structure
 
     def _create_networkx_graph(self) -> nx.Graph:
         """Create a NetworkX graph from campus data."""
         G = nx.Graph()  # Initialize an empty NetworkX graph
         
-        print("\nCreating NetworkX Graph:")  # Debug message for graph creation
-        
         # Add nodes to the graph
         for loc_id, location in self.campus_data.locations.items():
             G.add_node(loc_id, pos=(location.x, location.y))  # Add node with position
-            print(f"Added node: {loc_id}")  # Debug message for added node
         
         # Add edges to the graph
         for path in self.campus_data.paths:
-            G.add_edge(path.start_id, path.end_id, weight=path.distance)  # Add edge with weight
-            print(f"Added edge: {path.start_id} -> {path.end_id} (distance: {path.distance})")  # Debug message for added edge
+            G.add_edge(path.start_id, path.end_id, weight=path.distance, is_accessible=path.is_accessible)  # Add edge with weight and accessibility
         
         return G  # Return the created graph
 
+    def _create_accessible_subgraph(self) -> nx.Graph:
+        """Create a standalone subgraph containing only accessible edges."""
+        G_accessible = nx.Graph()  # Standalone graph so lookups don't go through a filtered view
+        G_accessible.add_weighted_edges_from(self.campus_data.accessible_edges(),
+                                             is_accessible=True)  # Edges in path order keep neighbor order stable
+        return G_accessible  # Return the accessible subgraph
+
+    def _build_adjacency(self) -> None:
+        """Precompute full and accessible-only adjacency lists in a single pass over the paths."""
+        full: Dict[str, List[Tuple[str, float]]] = {loc_id: [] for loc_id in self.campus_data.locations}  # All edges
+        acc: Dict[str, List[Tuple[str, float]]] = {loc_id: [] for loc_id in self.campus_data.locations}  # Accessible edges only
+        edge_weight: Dict[Tuple[str, str], float] = {}  # Edge weight keyed by (u, v) in both directions
+        for path in self.campus_data.paths:
+            u, v, w = path.start_id, path.end_id, path.distance  # Unpack the path once
+            edge_weight[(u, v)] = edge_weight[(v, u)] = w  # Both directions, no branching
+            forward, backward = (v, w), (u, w)  # Neighbor entries for each endpoint
+            full.setdefault(u, []).append(forward)  # Forward direction
+            full.setdefault(v, []).append(backward)  # Reverse direction
+            if path.is_accessible:  # Only accessible paths go into the filtered list
+                acc.setdefault(u, []).append(forward)  # Forward direction
+                acc.setdefault(v, []).append(backward)  # Reverse direction
+
+        self._landmark_ids = frozenset(loc_id for loc_id in self.campus_data.locations
+                                       if not loc_id.startswith('waypoint_'))  # Non-waypoint nodes, classified once
+        # Freeze the neighbor lists into tuples: smaller and faster to iterate
+        self._adj_full: Dict[str, Tuple[Tuple[str, float], ...]] = {k: tuple(nbrs) for k, nbrs in full.items()}
+        self._adj_acc: Dict[str, Tuple[Tuple[str, float], ...]] = {k: tuple(nbrs) for k, nbrs in acc.items()}
+        self._edge_weight = edge_weight  # Store the edge-weight map
+
+    def _build_csr(self) -> None:
+        """Build CSR adjacency arrays (plus ID/index maps) used by the Dijkstra kernel."""
+        self._idx_to_id: List[str] = list(self.campus_data.locations)  # Node index -> location ID
+        self._id_to_idx: Dict[str, int] = {loc_id: i for i, loc_id in enumerate(self._idx_to_id)}  # Location ID -> node index
+        rows: List[List[Tuple[int, float, bool]]] = [[] for _ in self._idx_to_id]  # Per-node (neighbor, weight, accessible)
+        for path in self.campus_data.paths:
+            u = self._id_to_idx[path.start_id]  # Start node index
+            v = self._id_to_idx[path.end_id]  # End node index
+            rows[u].append((v, path.distance, path.is_accessible))  # Forward direction
+            rows[v].append((u, path.distance, path.is_accessible))  # Reverse direction
+
+        self._csr_indptr = np.zeros(len(rows) + 1, dtype=np.int32)  # Row pointers
+        self._csr_indptr[1:] = np.cumsum([len(row) for row in rows])  # Prefix sums of node degrees
+        flat = [entry for row in rows for entry in row]  # Flatten rows in node order
+        self._csr_indices = np.array([e[0] for e in flat], dtype=np.int32)  # Neighbor indices
+        self._csr_weights = np.array([e[1] for e in flat], dtype=np.float64)  # Edge weights
+        self._csr_accessible = np.array([e[2] for e in flat], dtype=np.bool_)  # Accessibility mask
+        self._csr_any = np.ones(len(flat), dtype=np.bool_)  # Mask that keeps every edge, for the compiled kernels
+        self._landmark_flags: List[int] = [int(loc_id in self._landmark_ids) for loc_id in self._idx_to_id]  # 1 per landmark node
+        self._csr_landmark = np.array(self._landmark_flags, dtype=np.int64)  # Same flags for the compiled landmark search
+        self._nbrs_full: List[List[int]] = [[e[0] for e in row] for row in rows]  # Integer neighbor lists for BFS/DFS
+        self._nbrs_acc: List[List[int]] = [[e[0] for e in row if e[2]] for row in rows]  # Accessible integer neighbor lists
+        # Weighted rows of plain Python numbers for the uncompiled kernels; NumPy scalar reads are slow in a loop
+        self._rows_full: List[Tuple[Tuple[int, float], ...]] = [tuple((e[0], e[1]) for e in row) for row in rows]
+        self._rows_acc: List[Tuple[Tuple[int, float], ...]] = [tuple((e[0], e[1]) for e in row if e[2]) for row in rows]
+
+        locations = self.campus_data.locations  # Local binding for the coordinate lookups
+        self._coords = np.array([(locations[loc_id].x, locations[loc_id].y) for loc_id in self._idx_to_id],
+                                dtype=np.float64).reshape(-1, 2)  # Node coordinates indexed like the CSR rows
+        # Largest scale that keeps the straight-line heuristic a lower bound on every edge weight
+        scale = math.inf  # Weight per unit of coordinate length, minimized over edges
+        for path in self.campus_data.paths:
+            start_loc = locations[path.start_id]  # Starting location
+            end_loc = locations[path.end_id]  # Ending location
+            span = math.hypot(end_loc.x - start_loc.x, end_loc.y - start_loc.y)  # Straight-line edge length
+            if span > 0:  # Ignore zero-length edges
+                scale = min(scale, path.distance / span)  # Tighten the bound
+        self._astar_scale = scale if math.isfinite(scale) else 0.0  # Zero degrades A* to Dijkstra
+
+    def _init_query_caches(self) -> None:
+        """(Re)create the per-instance LRU caches for single-pair route queries."""
+        self._bfs_cached = lru_cache(maxsize=512)(self._bfs)  # Memoized BFS keyed by (start, end, accessible_only)
+        self._dijkstra_cached = lru_cache(maxsize=512)(self._dijkstra)  # Memoized Dijkstra
+        self._astar_cached = lru_cache(maxsize=512)(self._astar)  # Memoized A*
+        self._landmark_path_cached = lru_cache(maxsize=512)(self._landmark_path)  # Memoized all-paths landmark search
+
     def _verify_graph(self):
-        """Verify graph structure and print debug info."""
-        print("\nGraph Verification:")  # Debug message for verification
-        print(f"Number of nodes: {self.G.number_of_nodes()}")  # Print number of nodes
-        print(f"Number of edges: {self.G.number_of_edges()}")  # Print number of edges
-        print(f"Nodes: {list(self.G.nodes())}")  # Print list of nodes
-        print(f"Sample of edges: {list(self.G.edges())[:5]}")  # Print sample of edges
+        """Verify graph structure and log debug info."""
+        if not logger.isEnabledFor(logging.DEBUG):  # Skip building the node/edge lists unless they will be logged
+            return
+        logger.debug("Graph has %d nodes and %d edges", self.G.number_of_nodes(), self.G.number_of_edges())  # Log graph size
+        logger.debug("Nodes: %s", list(self.G.nodes()))  # Log list of nodes
+        logger.debug("Sample of edges: %s", list(self.G.edges())[:5])  # Log sample of edges
     
+    def path_distance(self, path: List[str]) -> float:
+        """Sum the edge weights along a node path using the cached edge-weight map."""
+        return sum(map(self._edge_weight.__getitem__, zip(path, path[1:])))  # Look up each (u, v) leg without index arithmetic
+
+    def count_landmarks(self, path: List[str]) -> int:
+        """Count the landmark (non-waypoint) nodes along a path."""
+        landmark_ids = self._landmark_ids  # Local binding for the loop
+        return sum(1 for node in path if node in landmark_ids)  # Set membership instead of a string prefix test
+
     def get_edge_list(self) -> List[Tuple[str, str]]:
         """Get list of edges for drawing."""
         return list(self.G.edges())  # Return list of edges
@@ -48,127 +393,368 @@ class GraphManager:
             edges.append((path[i], path[i + 1]))  # Append edge from path
         return edges  # Return list of edges
 
-    def get_adjacent_nodes(self, node_id: str, accessible_only: bool = False) -> List[Tuple[str, float]]:
+    def get_adjacent_nodes(self, node_id: str, accessible_only: bool = False) -> Tuple[Tuple[str, float], ...]:
         """Get adjacent nodes and their distances."""
-        adjacent = []  # Initialize list for adjacent nodes
-        for path in self.campus_data.paths:
-            if path.start_id == node_id:  # Check if path starts from the node
-                if not accessible_only or path.is_accessible:  # Check accessibility if required
-                    adjacent.append((path.end_id, path.distance))  # Append adjacent node and distance
-            elif path.end_id == node_id:  # Check if path ends at the node
-                if not accessible_only or path.is_accessible:  # Check accessibility if required
-                    adjacent.append((path.start_id, path.distance))  # Append adjacent node and distance
-        return adjacent  # Return list of adjacent nodes
-
-    def get_adjacency_list(self, accessible_only: bool = False) -> Dict[str, List[Tuple[str, float]]]:
+        adj = self._adj_acc if accessible_only else self._adj_full  # Pick the precomputed adjacency list
+        return adj.get(node_id, ())  # Single dict lookup instead of scanning every path
+
+    def get_adjacency_list(self, accessible_only: bool = False) -> Dict[str, Tuple[Tuple[str, float], ...]]:
         """Convert campus data to adjacency list format."""
-        adj_list = {}  # Initialize adjacency list
-        for node_id in self.campus_data.locations:
-            adj_list[node_id] = self.get_adjacent_nodes(node_id, accessible_only)  # Populate adjacency list
-        return adj_list  # Return adjacency list
+        return self._adj_acc if accessible_only else self._adj_full  # Shared cached dict; callers must not mutate it
+
+    def get_location_info(self, location_id: str) -> Optional[Dict]:
+        """
+        Get information about a specific location.
+        
+        Args:
+            location_id (str): The ID of the location to retrieve information for.
+        
+        Returns:
+            Optional[Dict]: A dictionary containing location information, or None if not found.
+        """
+        location = self.campus_data.locations.get(location_id)  # Look up the location
+        if location is None:  # Location not found
+            return None
+        return {
+            'name': location.name,  # Name of the location
+            'type': location.type,  # Type of the location (e.g., building, waypoint)
+            'x': location.x,  # X coordinate of the location
+            'y': location.y,  # Y coordinate of the location
+            'is_accessible': location.is_accessible  # Accessibility status
+        }
+    
+    def get_connected_locations(self, location_id: str) -> List[str]:
+        """
+        Get list of locations connected to the given location.
+        
+        Args:
+            location_id (str): The ID of the location to find connections for.
+        
+        Returns:
+            List[str]: A list of IDs of connected locations.
+        """
+        return [neighbor for neighbor, _ in self._adj_full.get(location_id, ())]  # Neighbor IDs from the cached adjacency list
 
     def bfs(self, start_id: str, end_id: str, accessible_only: bool = False) -> Optional[List[str]]:
-        """Breadth-First Search implementation using NetworkX."""
+        """Breadth-First Search, memoized per (start, end, accessible_only)."""
+        path = self._bfs_cached(start_id, end_id, accessible_only)  # Cached result, shared between calls
+        return list(path) if path else None  # Copy so callers can't mutate the cache
+
+    def _bfs(self, start_id: str, end_id: str, accessible_only: bool = False) -> Optional[List[str]]:
+        """Breadth-First Search using parent pointers over the integer adjacency lists."""
         if start_id not in self.G or end_id not in self.G:  # Check if start and end nodes are in the graph
             return None  # Return None if nodes are not found
+        if start_id == end_id:  # Trivial path
+            return [start_id]  # Path consists of the start node only
 
-        if accessible_only:
-            # Create a subgraph with only accessible edges
-            accessible_edges = [(u, v) for (u, v, d) in self.G.edges(data=True) if d['is_accessible']]  # Filter accessible edges
-            G_accessible = self.G.edge_subgraph(accessible_edges)  # Create subgraph with accessible edges
-            try:
-                path = nx.single_source_shortest_path(G_accessible, start_id)[end_id]  # Find path in subgraph
-                return path  # Return found path
-            except KeyError:
-                return None  # Return None if path not found
-        else:
-            try:
-                path = nx.single_source_shortest_path(self.G, start_id)[end_id]  # Find path in full graph
-                return path  # Return found path
-            except KeyError:
-                return None  # Return None if path not found
+        nbrs = self._nbrs_acc if accessible_only else self._nbrs_full  # Pick the integer adjacency lists
+        src = self._id_to_idx[start_id]  # Translate start ID to node index
+        dst = self._id_to_idx[end_id]  # Translate end ID to node index
+        parent = [-1] * len(nbrs)  # Parent pointers indexed by node
+        seen = bytearray(len(nbrs))  # Visited flags indexed by node
+        seen[src] = 1  # Mark the start node as visited
+        queue = deque([src])  # Queue holds node indices only, not whole paths
+        while queue:
+            node = queue.popleft()  # Dequeue the next node
+            for neighbor in nbrs[node]:  # Iterate through neighbor indices
+                if not seen[neighbor]:  # Check if neighbor is unvisited
+                    seen[neighbor] = 1  # Mark neighbor as visited
+                    parent[neighbor] = node  # Remember how we reached the neighbor
+                    if neighbor == dst:  # Stop as soon as the target is discovered
+                        return self._reconstruct_path(parent, dst)  # Walk parents back to the start
+                    queue.append(neighbor)  # Enqueue neighbor for expansion
+        return None  # Return None if path not found
+
+    def _reconstruct_path(self, parent: List[int], end: int) -> List[str]:
+        """Rebuild a path of location IDs from integer parent pointers, ending at end."""
+        path = []  # Initialize list for the path
+        node = end  # Start from the target
+        while node != -1:
+            path.append(self._idx_to_id[node])  # Translate index back to location ID
+            node = parent[node]  # Step back to its parent
+        path.reverse()  # Parents were collected target-first
+        return path  # Return path from start to end
 
     def dfs(self, start_id: str, end_id: str, accessible_only: bool = False) -> Optional[List[str]]:
         """Depth-First Search implementation."""
         if start_id not in self.G or end_id not in self.G:  # Check if start and end nodes are in the graph
             return None  # Return None if nodes are not found
 
-        def dfs_path(current, target, visited):
-            """Recursive helper function for DFS."""
-            if current == target:  # Check if current node is the target
-                return [current]  # Return path to target
-            
-            visited.add(current)  # Mark current node as visited
-            for neighbor in self.G.neighbors(current):  # Iterate through neighbors
-                if neighbor not in visited:  # Check if neighbor is unvisited
-                    path = dfs_path(neighbor, target, visited)  # Recursive call
-                    if path:  # If path is found
-                        return [current] + path  # Return path including current node
-            return None  # Return None if no path found
-
-        return dfs_path(start_id, end_id, set())  # Start DFS from the initial node
-
-    def dfs_all_paths(self, start_id: str, end_id: str, accessible_only: bool = False) -> List[List[str]]:
-        """Find all possible paths between two nodes using DFS."""
+        if start_id == end_id:  # Trivial path
+            return [start_id]  # Path consists of the start node only
+
+        nbrs = self._nbrs_acc if accessible_only else self._nbrs_full  # Pick the integer adjacency lists
+        src = self._id_to_idx[start_id]  # Translate start ID to node index
+        dst = self._id_to_idx[end_id]  # Translate end ID to node index
+        visited = bytearray(len(nbrs))  # Visited flags indexed by node
+        visited[src] = 1  # Mark the start node as visited
+        path = [src]  # Current path, kept in lockstep with the stack
+        stack = [iter(nbrs[src])]  # Explicit stack of neighbor iterators
+        while stack:
+            for neighbor in stack[-1]:  # Advance the top frame's iterator
+                if not visited[neighbor]:  # Check if neighbor is unvisited
+                    if neighbor == dst:  # Target reached
+                        path.append(neighbor)  # Complete the path
+                        return [self._idx_to_id[i] for i in path]  # Translate indices back to IDs
+                    visited[neighbor] = 1  # Mark neighbor as visited
+                    path.append(neighbor)  # Descend into neighbor
+                    stack.append(iter(nbrs[neighbor]))  # Push its neighbor iterator
+                    break
+            else:  # Iterator exhausted: backtrack
+                stack.pop()  # Drop the frame
+                path.pop()  # Remove its node from the path
+        return None  # Return None if no path found
+
+    def iter_all_paths(self, start_id: str, end_id: str, accessible_only: bool = False,
+                       max_depth: Optional[int] = None) -> Iterator[List[str]]:
+        """Yield every simple path between two nodes, one at a time in DFS order.
+
+        Nothing is stored beyond the current path, so callers that only need the best
+        path by some metric can keep a running best instead of a list of all paths.
+        max_depth limits paths to that many hops; None means no limit.
+        """
         if start_id not in self.G or end_id not in self.G:  # Check if start and end nodes are in the graph
-            return []  # Return empty list if nodes are not found
-
-        def dfs_paths(current, target, path, visited, all_paths):
-            """Recursive helper function to find all paths."""
-            path.append(current)  # Add current node to path
-            
-            if current == target:  # Check if current node is the target
-                all_paths.append(path.copy())  # Save a copy of the path
-            else:
-                for neighbor in self.G.neighbors(current):  # Iterate through neighbors
-                    if neighbor not in visited:  # Check if neighbor is unvisited
-                        visited.add(neighbor)  # Mark neighbor as visited
-                        dfs_paths(neighbor, target, path, visited, all_paths)  # Recursive call
-                        visited.remove(neighbor)  # Backtrack: unmark neighbor
-            
-            path.pop()  # Backtrack: remove current node from path
-
-        all_paths = []  # Initialize list to store all found paths
-        dfs_paths(start_id, end_id, [], {start_id}, all_paths)  # Start DFS for all paths
+            return
+        if start_id == end_id:  # Trivial path
+            yield [start_id]  # Path consists of the start node only
+            return
+        nbrs = self._nbrs_acc if accessible_only else self._nbrs_full  # Pick the integer adjacency lists
+        idx_to_id = self._idx_to_id  # Local binding for path translation
+        src = self._id_to_idx[start_id]  # Translate start ID to node index
+        dst = self._id_to_idx[end_id]  # Translate end ID to node index
+        visited = bytearray(len(nbrs))  # Flags for nodes on the current path
+        visited[src] = 1  # Mark the start node as visited
+        path = [src]  # Current path, kept in lockstep with the stack
+        hops = len(nbrs) if max_depth is None else max_depth  # A simple path never has as many hops as nodes
+        stack = [iter(nbrs[src])]  # Explicit stack of neighbor iterators
+        push, pop = stack.append, stack.pop  # Bound methods hoisted out of the loop
+        path_append, path_pop = path.append, path.pop
+        while stack:
+            for neighbor in stack[-1]:  # Advance the top frame's iterator
+                if visited[neighbor]:  # Skip nodes already on the path
+                    continue
+                if neighbor == dst:  # Target reached
+                    yield [idx_to_id[i] for i in path] + [end_id]  # Hand out the completed path as IDs
+                    continue
+                if len(path) >= hops:  # Going deeper cannot reach the target within max_depth hops
+                    continue
+                visited[neighbor] = 1  # Mark neighbor as visited
+                path_append(neighbor)  # Descend into neighbor
+                push(iter(nbrs[neighbor]))  # Push its neighbor iterator
+                break
+            else:  # Iterator exhausted: backtrack
+                pop()  # Drop the frame
+                visited[path_pop()] = 0  # Backtrack: unmark the node
+
+    def dfs_all_paths(self, start_id: str, end_id: str, accessible_only: bool = False,
+                      verbose: bool = False, max_depth: Optional[int] = None,
+                      max_paths: Optional[int] = None) -> List[List[str]]:
+        """Find all possible paths between two nodes using DFS.
+
+        max_depth limits paths to that many hops and max_paths stops after that many are found;
+        None means no limit.
+        """
+        all_paths = list(islice(self.iter_all_paths(start_id, end_id, accessible_only, max_depth),
+                                max_paths))  # Collect the streamed paths, up to max_paths
         
-        # Print all paths and their characteristics
-        print(f"\nFound {len(all_paths)} possible paths:")  # Debug message for found paths
-        for i, path in enumerate(all_paths):  # Iterate through found paths
-            # Calculate path distance
-            distance = sum(self.G[path[j]][path[j+1]]['weight'] 
-                          for j in range(len(path)-1))  # Sum weights of edges in the path
-            # Count landmarks (non-waypoint nodes)
-            landmarks = sum(1 for node in path 
-                           if not node.startswith('waypoint_'))  # Count non-waypoint nodes
-            
-            print(f"\nPath {i+1}:")  # Debug message for path
-            print(f"Route: {' -> '.join(path)}")  # Print route
-            print(f"Distance: {distance:.2f} meters")  # Print distance
-            print(f"Landmarks passed: {landmarks}")  # Print number of landmarks
+        if verbose:  # Only summarize paths when explicitly requested
+            print(f"\nFound {len(all_paths)} possible paths:")  # Debug message for found paths
+            for i, path in enumerate(all_paths):  # Iterate through found paths
+                distance = self.path_distance(path)  # Sum cached edge weights along the path
+                landmarks = self.count_landmarks(path)  # Count non-waypoint nodes
+                
+                print(f"\nPath {i+1}:")  # Debug message for path
+                print(f"Route: {' -> '.join(path)}")  # Print route
+                print(f"Distance: {distance:.2f} meters")  # Print distance
+                print(f"Landmarks passed: {landmarks}")  # Print number of landmarks
         
         return all_paths  # Return all found paths
 
+    def landmark_path(self, start_id: str, end_id: str, accessible_only: bool = False) -> Optional[Tuple[List[str], float]]:
+        """Simple path passing the most landmarks, memoized per (start, end, accessible_only).
+
+        Ties go to the path found first by dfs_all_paths.
+        """
+        result = self._landmark_path_cached(start_id, end_id, accessible_only)  # Cached result, shared between calls
+        return (list(result[0]), result[1]) if result else None  # Copy the path so callers can't mutate the cache
+
+    def _landmark_path(self, start_id: str, end_id: str, accessible_only: bool = False) -> Optional[Tuple[List[str], float]]:
+        if start_id not in self.G or end_id not in self.G:  # Check if start and end nodes are in the graph
+            return None
+        if start_id == end_id:  # Trivial path
+            return [start_id], self.path_distance([start_id])
+        src = self._id_to_idx[start_id]  # Translate start ID to node index
+        dst = self._id_to_idx[end_id]  # Translate end ID to node index
+        nbrs = self._nbrs_acc if accessible_only else self._nbrs_full  # Pick the integer adjacency lists
+        seen = bytearray(len(nbrs))  # Nodes reachable from the start
+        seen[src] = 1
+        component = [src]  # Breadth-first order; grows while being iterated
+        for u in component:
+            for v in nbrs[u]:
+                if not seen[v]:
+                    seen[v] = 1
+                    component.append(v)
+        if not seen[dst]:  # Not connected: skip walking every path of the component
+            return None
+        landmark = self._landmark_flags  # 1 per landmark node index
+        max_count = sum(landmark[i] for i in component)  # No simple path can pass more landmarks than this
+        if _HAVE_NUMBA:  # Compiled search over the CSR arrays
+            mask = self._csr_accessible if accessible_only else self._csr_any  # Restrict to accessible edges if requested
+            best = _landmark_dfs_compiled(self._csr_indptr, self._csr_indices, mask, self._csr_landmark, src, dst,
+                                          max_count,
+                                          -1 if self.landmark_max_depth is None else self.landmark_max_depth,
+                                          -1 if self.landmark_max_paths is None else self.landmark_max_paths).tolist()
+        else:
+            best = self._landmark_dfs(src, dst, accessible_only, max_count,
+                                      self.landmark_max_depth, self.landmark_max_paths)
+        if not best:  # Nodes not connected
+            return None
+        path = [self._idx_to_id[i] for i in best]  # Translate back to location IDs
+        return path, self.path_distance(path)
+
+    def _landmark_dfs(self, src: int, dst: int, accessible_only: bool, max_count: int,
+                      max_depth: Optional[int] = None, max_paths: Optional[int] = None) -> List[int]:
+        """Pure-Python twin of _landmark_dfs_compiled over the integer adjacency lists.
+
+        Walks simple paths in dfs_all_paths order with a running landmark count and keeps
+        only the first path with the most landmarks.
+
+        Args:
+            src: Index of the start node
+            dst: Index of the target node (must differ from src)
+            accessible_only: Restrict the search to accessible paths
+            max_count: Upper bound on any path's landmark count; the search stops once a path reaches it
+            max_depth: Longest path considered, in hops; None for no limit
+            max_paths: Stop after this many paths reach dst; None for no limit
+
+        Returns:
+            Node indices of the chosen path, or an empty list if dst is unreachable
+        """
+        nbrs = self._nbrs_acc if accessible_only else self._nbrs_full  # Pick the integer adjacency lists
+        landmark = self._landmark_flags  # 1 per landmark node index
+        visited = bytearray(len(nbrs))  # Flags for nodes on the current path
+        visited[src] = 1  # Mark the start node as visited
+        path = [src]  # Current path, kept in lockstep with the stack
+        count = landmark[src]  # Landmarks on the current path
+        best: List[int] = []  # Best path found so far
+        best_count = -1  # Its landmark count
+        hops = len(nbrs) if max_depth is None else max_depth  # A simple path never has as many hops as nodes
+        paths_left = -1 if max_paths is None else max_paths  # Countdown to the candidate budget
+        stack = [iter(nbrs[src])]  # Explicit stack of neighbor iterators
+        push, pop = stack.append, stack.pop  # Bound methods hoisted out of the loop
+        path_append, path_pop = path.append, path.pop
+        while stack:
+            for neighbor in stack[-1]:  # Advance the top frame's iterator
+                if visited[neighbor]:  # Skip nodes already on the path
+                    continue
+                if neighbor == dst:  # Target reached: keep the path if it beats the best so far
+                    if count + landmark[dst] > best_count:
+                        best_count = count + landmark[dst]
+                        best = path + [dst]
+                        if best_count >= max_count:  # No remaining path can beat it
+                            return best
+                    paths_left -= 1
+                    if paths_left == 0:  # Candidate budget spent
+                        return best
+                    continue
+                if len(path) >= hops:  # Going deeper cannot reach dst within max_depth hops
+                    continue
+                visited[neighbor] = 1  # Mark neighbor as visited
+                path_append(neighbor)  # Descend into neighbor
+                count += landmark[neighbor]
+                push(iter(nbrs[neighbor]))  # Push its neighbor iterator
+                break
+            else:  # Iterator exhausted: backtrack
+                pop()  # Drop the frame
+                node = path_pop()  # Backtrack: unmark the node
+                visited[node] = 0
+                count -= landmark[node]
+        return best
+
+    def _shortest_path_tree(self, src: int, dst: int, accessible_only: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """Run Dijkstra from node index `src`, compiled when numba is available.
+
+        Returns:
+            Tuple of (dist, prev) indexed by node: arrays from the compiled kernel, lists otherwise
+        """
+        if _HAVE_NUMBA:  # Compiled kernel takes an explicit mask
+            mask = self._csr_accessible if accessible_only else self._csr_any  # Restrict to accessible edges if requested
+            return _dijkstra_csr_compiled(self._csr_indptr, self._csr_indices, self._csr_weights, mask, src, dst)
+        return _dijkstra_rows(self._rows_acc if accessible_only else self._rows_full, src, dst)  # heapq fallback
+
     def dijkstra(self, start_id: str, end_id: str, accessible_only: bool = False) -> Optional[Tuple[List[str], float]]:
-        """Dijkstra's algorithm implementation using NetworkX."""
-        print(f"\nDijkstra Debug:")  # Debug message for Dijkstra's algorithm
-        print(f"Looking for path from {start_id} to {end_id}")  # Print start and end nodes
+        """Dijkstra's algorithm, memoized per (start, end, accessible_only)."""
+        result = self._dijkstra_cached(start_id, end_id, accessible_only)  # Cached result, shared between calls
+        return (list(result[0]), result[1]) if result else None  # Copy the path so callers can't mutate the cache
+
+    def _dijkstra(self, start_id: str, end_id: str, accessible_only: bool = False) -> Optional[Tuple[List[str], float]]:
+        """Dijkstra's algorithm over the precomputed CSR adjacency arrays."""
+        if start_id not in self.G or end_id not in self.G:  # Check if start and end nodes are in the graph
+            logger.debug("Dijkstra: start %s in graph: %s, end %s in graph: %s",
+                         start_id, start_id in self.G, end_id, end_id in self.G)  # Log which node is missing
+            return None  # Return None if nodes are not found
         
+        src = self._id_to_idx[start_id]  # Translate start ID to node index
+        dst = self._id_to_idx[end_id]  # Translate end ID to node index
+        dist, prev = self._shortest_path_tree(src, dst, accessible_only)  # Run the kernel
+        if np.isinf(dist[dst]):  # Target was never reached
+            logger.debug("Dijkstra found no path from %s to %s", start_id, end_id)  # Log no path found
+            return None  # Return None if no path exists
+
+        path = self._reconstruct_path(prev, dst)  # Walk predecessors back to the start
+        distance = float(dist[dst])  # Path length from the same traversal
+        logger.debug("Dijkstra path %s (distance %.2f)", path, distance)  # Log found path and distance
+        return path, distance  # Return path and distance
+
+    def all_shortest_paths_from(self, start_id: str, accessible_only: bool = False) -> Dict[str, Tuple[List[str], float]]:
+        """
+        Shortest paths from one location to every reachable location in a single Dijkstra run.
+        
+        Args:
+            start_id (str): The ID of the source location.
+            accessible_only (bool): Restrict the search to accessible paths.
+        
+        Returns:
+            Dict[str, Tuple[List[str], float]]: Path and distance keyed by destination ID.
+        """
+        if start_id not in self.G:  # Check if the start node is in the graph
+            return {}  # Nothing is reachable from an unknown node
+        
+        src = self._id_to_idx[start_id]  # Translate start ID to node index
+        dist, prev = self._shortest_path_tree(src, -1, accessible_only)  # No target: settle everything
+        return {
+            self._idx_to_id[i]: (self._reconstruct_path(prev, i), float(dist[i]))  # Path and distance per destination
+            for i in np.flatnonzero(np.isfinite(dist)).tolist()  # Reachable nodes only
+        }
+
+    def astar(self, start_id: str, end_id: str, accessible_only: bool = False) -> Optional[Tuple[List[str], float]]:
+        """A* search, memoized per (start, end, accessible_only)."""
+        result = self._astar_cached(start_id, end_id, accessible_only)  # Cached result, shared between calls
+        return (list(result[0]), result[1]) if result else None  # Copy the path so callers can't mutate the cache
+
+    def _astar(self, start_id: str, end_id: str, accessible_only: bool = False) -> Optional[Tuple[List[str], float]]:
+        """A* search over the plain adjacency rows using straight-line distance as the heuristic."""
         if start_id not in self.G or end_id not in self.G:  # Check if start and end nodes are in the graph
-            print(f"Start node in graph: {start_id in self.G}")  # Print existence of start node
-            print(f"End node in graph: {end_id in self.G}")  # Print existence of end node
             return None  # Return None if nodes are not found
         
-        try:
-            path = nx.shortest_path(self.G, start_id, end_id, weight='weight')  # Find shortest path
-            distance = nx.shortest_path_length(self.G, start_id, end_id, weight='weight')  # Calculate path length
-            print(f"Found path: {path}")  # Print found path
-            print(f"Path distance: {distance}")  # Print path distance
-            return path, distance  # Return path and distance
-        except nx.NetworkXNoPath:
-            print(f"NetworkX could not find a path between nodes!")  # Debug message for no path found
+        src = self._id_to_idx[start_id]  # Translate start ID to node index
+        dst = self._id_to_idx[end_id]  # Translate end ID to node index
+        rows = self._rows_acc if accessible_only else self._rows_full  # Restrict to accessible edges if requested
+        dist, prev = _astar_rows(rows, self._coords, self._astar_scale, src, dst)  # Run the kernel
+        if np.isinf(dist[dst]):  # Target was never reached
+            logger.debug("A* found no path from %s to %s", start_id, end_id)  # Log no path found
             return None  # Return None if no path exists
 
+        path = self._reconstruct_path(prev, dst)  # Walk predecessors back to the start
+        distance = float(dist[dst])  # Path length from the same traversal
+        logger.debug("A* path %s (distance %.2f)", path, distance)  # Log found path and distance
+        return path, distance  # Return path and distance
+
     def reinitialize_with_data(self, campus_data: CampusData):
         """Reinitialize the graph with new campus data."""
         self.campus_data = campus_data  # Update campus data
-        self.G = self._create_networkx_graph()  # Recreate the graph with new data
\ No newline at end of file
+        self.G = self._create_networkx_graph()  # Recreate the graph with new data
+        self.G_accessible = self._create_accessible_subgraph()  # Recreate the accessible subgraph
+        self._build_adjacency()  # Rebuild the cached adjacency lists
+        self._build_csr()  # Rebuild the CSR arrays
+        self._init_query_caches()  # Drop results computed on the old data
\ No newline at end of file
@@ -1,11 +1,21 @@
 # Import necessary modules for type hinting, data classes, JSON handling, and file path management
-from typing import Dict, List, Tuple
-from dataclasses import dataclass
+from typing import Dict, Iterable, KeysView, List, Optional, Set, Tuple, ValuesView
+from dataclasses import dataclass, field, asdict
 import json
-from pathlib import Path
+import logging
+import sys
+from pathlib import Path as PathLib
+import numpy as np
+
+try:
+    import orjson  # Optional faster JSON parser
+except ImportError:
+    orjson = None  # Fall back to the standard library json module
+
+logger = logging.getLogger(__name__)  # Module-level logger
 
 # Define a data class for Location to represent a place on campus
-@dataclass
+@dataclass(slots=True)
 class Location:
     id: str  # Unique identifier for the location
     name: str  # Name of the location
@@ -15,15 +25,10 @@ class Location:
     full_name: str = ""  # Full name of the location (optional)
     is_accessible: bool = True  # Accessibility status of the location
     is_waypoint: bool = False  # Indicates if the location is a waypoint
-    connections: List[str] = None  # List of connected location IDs
-
-    # Post-initialization to ensure connections is initialized as an empty list if not provided
-    def __post_init__(self):
-        if self.connections is None:
-            self.connections = []  # Initialize connections to an empty list
+    connections: Set[str] = field(default_factory=set)  # Set of connected location IDs
 
 # Define a data class for Path to represent a connection between two locations
-@dataclass
+@dataclass(slots=True)
 class Path:
     start_id: str  # ID of the starting location
     end_id: str  # ID of the ending location
@@ -31,73 +36,288 @@ class Path:
     path_type: str = "walkway"  # Type of path (default is "walkway")
     is_accessible: bool = True  # Accessibility status of the path
 
+def _pair_key(a: str, b: str) -> Tuple[str, str]:
+    """Order-independent key for the path between two locations."""
+    return (a, b) if a <= b else (b, a)  # Sorted tuple hashes faster than building a frozenset
+
 # Class to manage campus data including locations and paths
 class CampusData:
     def __init__(self):
         # Initialize dictionaries to hold locations and paths
+        # Keys must only ever be str: CPython keeps all-str dicts in a compact layout that stores no hashes,
+        # and a single non-str key converts the whole table to the larger general layout
         self.locations: Dict[str, Location] = {}  # Dictionary of locations keyed by their IDs
         self.paths: List[Path] = []  # List to hold paths between locations
+        self._reset_location_rows()  # Empty coordinate buffer
+
+    def _reset_location_rows(self) -> None:
+        """Rebuild the structure-of-arrays coordinate buffer from the location dict."""
+        n = len(self.locations)  # Number of locations
+        self._xy_buf = np.empty((max(n, 16), 2), dtype=np.float64)  # Row storage with headroom
+        if n:  # Copy coordinates in dict order
+            self._xy_buf[:n] = [(loc.x, loc.y) for loc in self.locations.values()]
+        self.loc_row_ids: List[Optional[str]] = list(self.locations)  # Row -> location ID (None for free rows)
+        self.loc_rows: Dict[str, int] = {loc_id: i for i, loc_id in enumerate(self.loc_row_ids)}  # Location ID -> row
+        self._free_rows: List[int] = []  # Rows released by deletions, reused first
+
+    @property
+    def loc_xy(self) -> np.ndarray:
+        """(rows, 2) array of location coordinates; free rows hold +inf."""
+        return self._xy_buf[:len(self.loc_row_ids)]  # View of the used rows
+
+    def _store_location_row(self, location: Location) -> None:
+        """Write a location's coordinates into its row, claiming one if needed."""
+        row = self.loc_rows.get(location.id)  # Existing row when replacing a location
+        if row is None:
+            if self._free_rows:  # Reuse a released row
+                row = self._free_rows.pop()
+            else:  # Append, doubling the buffer when full
+                row = len(self.loc_row_ids)
+                if row == len(self._xy_buf):
+                    self._xy_buf = np.concatenate((self._xy_buf, np.empty_like(self._xy_buf)))
+                self.loc_row_ids.append(None)
+            self.loc_row_ids[row] = location.id  # Claim the row
+            self.loc_rows[location.id] = row
+        self._xy_buf[row] = (location.x, location.y)  # Mirror the coordinates
+
+    def _release_location_row(self, location_id: str) -> None:
+        """Free a deleted location's row for reuse."""
+        row = self.loc_rows.pop(location_id)  # Row held by the location
+        self.loc_row_ids[row] = None  # Mark the row unused
+        self._xy_buf[row] = np.inf  # Never within reach of a distance query
+        self._free_rows.append(row)  # Make it available to the next insert
+
+    @property
+    def paths(self) -> ValuesView[Path]:
+        """Paths between locations, in insertion order (a live read-only view)."""
+        return self._path_map.values()  # View over the pair-keyed map
+
+    @paths.setter
+    def paths(self, paths: Iterable[Path]) -> None:
+        self._path_map: Dict[Tuple[str, str], Path] = {}  # Endpoint pair -> path, in insertion order
+        self._adj: Dict[str, Dict[str, Path]] = {}  # Location ID -> neighbor ID -> connecting path
+        for path in paths:  # Index every path in both directions
+            self._path_map[_pair_key(path.start_id, path.end_id)] = path  # One path per pair
+            self._index_path(path)
+        self._soa_dirty = True  # Columnar copy no longer matches
+
+    def _index_path(self, path: Path) -> None:
+        """Record a path in the adjacency map under both endpoints."""
+        self._adj.setdefault(path.start_id, {})[path.end_id] = path  # Forward direction
+        self._adj.setdefault(path.end_id, {})[path.start_id] = path  # Reverse direction
+
+    def _drop_path(self, path: Path) -> None:
+        """Delete a path from the pair-keyed map; the remaining order is unchanged."""
+        del self._path_map[_pair_key(path.start_id, path.end_id)]  # O(1), no list rebuild or reordering
+
+    def bulk_load(self, locations: Iterable[Location], paths: Iterable[Path]) -> None:
+        """Replace all locations and paths in one pass and build the derived arrays once.
+
+        Args:
+            locations: Locations in the order their coordinate rows should take
+            paths: Paths in list order; a later path replaces an earlier one between the same pair
+        """
+        self.locations = {location.id: location for location in locations}  # Locations keyed by ID
+        self._reset_location_rows()  # Mirror coordinates into the row buffer in one copy
+        self.paths = paths  # Pair-keyed map and adjacency in one pass
+        self.finalize()  # Build the columnar path arrays
 
     def add_location(self, location: Location) -> None:
         """Add a new location to the campus."""
-        # Ensure connections are initialized
-        if location.connections is None:
-            location.connections = []  # Initialize connections if None
         self.locations[location.id] = location  # Add the location to the dictionary
+        self._store_location_row(location)  # Mirror its coordinates
+        self._soa_dirty = True  # Location index needs rebuilding
 
     def add_path(self, path: Path) -> None:
-        """Add a new path between locations."""
-        self.paths.append(path)  # Append the new path to the list of paths
+        """Add a path between locations, replacing any existing path between the same pair."""
+        self._path_map[_pair_key(path.start_id, path.end_id)] = path  # A replaced pair keeps its position
+        self._index_path(path)  # Keep the adjacency map in step
+        self._soa_dirty = True  # Columnar copy no longer matches
+
+    def has_path(self, start_id: str, end_id: str) -> bool:
+        """Check whether a path connects two locations, in either direction."""
+        return end_id in self._adj.get(start_id, ())  # O(1) adjacency lookup
+
+    def neighbors(self, location_id: str) -> Dict[str, Path]:
+        """Neighbors of a location mapped to the connecting paths; treat as read-only."""
+        return self._adj.get(location_id, {})  # Live view of the adjacency map
+
+    def remove_path(self, start_id: str, end_id: str) -> Optional[Path]:
+        """Remove the path between two locations and return it, or None if there is none."""
+        path = self._adj.get(start_id, {}).pop(end_id, None)  # Forward direction
+        if path is None:  # Nothing connects the two locations
+            return None
+        del self._adj[end_id][start_id]  # Reverse direction
+        self._drop_path(path)  # Delete from the pair-keyed path map
+        self._soa_dirty = True  # Columnar copy no longer matches
+        return path
+
+    def remove_location(self, location_id: str) -> KeysView[str]:
+        """Remove a location and every path touching it, in place.
+
+        Only the location's own neighbors are visited: each loses its reverse
+        adjacency entry and its connection to the location, and each shared
+        path is deleted from the pair-keyed path map.
+
+        Returns:
+            IDs of the locations that were connected to the removed one
+        """
+        neighbors = self._adj.pop(location_id, {})  # Paths touching the location, keyed by the other end
+        for other, path in neighbors.items():
+            del self._adj[other][location_id]  # Forget the reverse direction
+            self.locations[other].connections.discard(location_id)  # Scrub the neighbor's connection
+            self._drop_path(path)  # Delete from the pair-keyed path map
+        del self.locations[location_id]  # Remove the location itself
+        self._release_location_row(location_id)  # Free its coordinate row
+        self._soa_dirty = True  # Location index needs rebuilding
+        return neighbors.keys()  # Former neighbors; the popped dict is no longer shared
+
+    def finalize(self) -> None:
+        """Freeze paths into NumPy structure-of-arrays columns for vectorized queries."""
+        self._loc_ids: List[str] = list(self.locations)  # Location index -> ID
+        self._loc_index: Dict[str, int] = {loc_id: i for i, loc_id in enumerate(self._loc_ids)}  # ID -> location index
+        n = len(self._path_map)  # Number of paths
+        self.path_start = np.fromiter((self._loc_index[p.start_id] for p in self._path_map.values()), np.int32, n)  # Start location indices
+        self.path_end = np.fromiter((self._loc_index[p.end_id] for p in self._path_map.values()), np.int32, n)  # End location indices
+        self.path_distance = np.fromiter((p.distance for p in self._path_map.values()), np.float64, n)  # Path distances
+        self.path_accessible = np.fromiter((p.is_accessible for p in self._path_map.values()), np.bool_, n)  # Path accessibility
+        self._soa_dirty = False  # Columns are up to date
+
+    def refresh_columns(self) -> None:
+        """Rebuild the columnar path arrays if edits have made them stale."""
+        if self._soa_dirty:  # Rebuild columns after edits
+            self.finalize()
+
+    def accessible_edges(self) -> List[Tuple[str, str, float]]:
+        """(start_id, end_id, distance) of every accessible path, in path order, filtered on the columns."""
+        self.refresh_columns()  # Rebuild columns after edits
+        ids = self._loc_ids  # Location index -> ID
+        mask = self.path_accessible  # Accessible paths only
+        return [(ids[s], ids[e], d) for s, e, d in zip(self.path_start[mask].tolist(), self.path_end[mask].tolist(),
+                                                       self.path_distance[mask].tolist())]
+
+    def path_mask(self, pairs: Iterable[Tuple[str, str]]) -> np.ndarray:
+        """Boolean column marking the paths stored as any of the given (start, end) ID pairs.
+
+        Pairs naming unknown locations are ignored; pass both orientations to match either direction.
+        """
+        self.refresh_columns()  # Rebuild columns after edits
+        index = self._loc_index  # Location ID -> location index
+        n = len(index)  # Pair codes are start * n + end
+        codes = [index[a] * n + index[b] for a, b in pairs if a in index and b in index]  # Known pairs as codes
+        return np.isin(self.path_start.astype(np.int64) * n + self.path_end, codes)  # One vectorized membership test
+
+    def recompute_all_distances(self, scale_factor: float) -> None:
+        """Recompute every path distance from its endpoint coordinates in one vectorized pass."""
+        n = len(self._path_map)  # Number of paths
+        if not n:  # Nothing to update
+            return
+        rows = self.loc_rows  # Location ID -> coordinate row
+        start_rows = np.fromiter((rows[p.start_id] for p in self._path_map.values()), np.intp, n)  # Start coordinate rows
+        end_rows = np.fromiter((rows[p.end_id] for p in self._path_map.values()), np.intp, n)  # End coordinate rows
+        delta = (self.loc_xy[end_rows] - self.loc_xy[start_rows]) * scale_factor  # Offsets in meters
+        distances = np.round(np.hypot(delta[:, 0], delta[:, 1]), 1)  # Rounded to 1 decimal place
+        for path, distance in zip(self._path_map.values(), distances.tolist()):  # Write back as plain floats
+            path.distance = distance
+        self._soa_dirty = True  # Columnar copy no longer matches
 
     def get_adjacent_locations(self, location_id: str) -> List[Tuple[str, float]]:
         """Get all locations adjacent to the given location with their distances."""
-        adjacent = []  # List to hold adjacent locations
-        # Iterate through all paths to find adjacent locations
-        for path in self.paths:
-            if path.start_id == location_id:
-                adjacent.append((path.end_id, path.distance))  # Add end location and distance
-            elif path.end_id == location_id:
-                adjacent.append((path.start_id, path.distance))  # Add start location and distance
-        return adjacent  # Return the list of adjacent locations
-
-    def save_to_json(self, filepath: Path) -> None:
+        self.refresh_columns()  # Rebuild columns after edits
+        i = self._loc_index.get(location_id)  # Look up the location index
+        if i is None:  # Unknown location has no neighbors
+            return []
+        hits = np.flatnonzero((self.path_start == i) | (self.path_end == i))  # Paths touching the location, in path order
+        starts = self.path_start[hits]  # Start indices of matching paths
+        others = np.where(starts == i, self.path_end[hits], starts)  # Pick the opposite endpoint of each path
+        return [(self._loc_ids[j], d) for j, d in zip(others.tolist(), self.path_distance[hits].tolist())]  # Translate back to IDs
+
+    def save_to_json(self, filepath: PathLib) -> None:
         """Save campus data to a JSON file."""
         # Prepare data for saving
         data = {
-            "locations": [vars(loc) for loc in self.locations.values()],  # Convert locations to dicts
-            "paths": [vars(path) for path in self.paths]  # Convert paths to dicts
+            "locations": [{**asdict(loc), "connections": sorted(loc.connections)}
+                          for loc in self.locations.values()],  # Convert locations to dicts, connections in stable order
+            "paths": [asdict(path) for path in self._path_map.values()]  # Convert paths to dicts
         }
         # Write data to the specified JSON file
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=4)  # Save data with indentation for readability
+        if orjson:  # Serialize straight to bytes in C (orjson only offers two-space indentation)
+            PathLib(filepath).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(data, f, indent=4)  # Save data with indentation for readability
+
+    def save_to_npz(self, filepath: PathLib) -> None:
+        """Save campus data to an uncompressed NumPy archive for fast reloading."""
+        locs = list(self.locations.values())  # Locations in dict order
+        index = {loc.id: i for i, loc in enumerate(locs)}  # ID -> archive position
+        conn_ptr = np.zeros(len(locs) + 1, dtype=np.int32)  # CSR offsets into conn_ids
+        conn_ptr[1:] = np.cumsum([len(loc.connections) for loc in locs])
+        np.savez(
+            filepath,
+            ids=np.array([loc.id for loc in locs], dtype=str),  # Location IDs
+            names=np.array([loc.name for loc in locs], dtype=str),  # Location names
+            full_names=np.array([loc.full_name for loc in locs], dtype=str),  # Full names
+            types=np.array([loc.type for loc in locs], dtype=str),  # Location types
+            xy=np.array([(loc.x, loc.y) for loc in locs], dtype=np.float64).reshape(-1, 2),  # Coordinates
+            loc_accessible=np.array([loc.is_accessible for loc in locs], dtype=np.bool_),  # Accessibility flags
+            loc_waypoint=np.array([loc.is_waypoint for loc in locs], dtype=np.bool_),  # Waypoint flags
+            conn_ptr=conn_ptr,
+            conn_ids=np.array([index[c] for loc in locs for c in loc.connections], dtype=np.int32),  # Connected positions
+            path_start=np.array([index[p.start_id] for p in self._path_map.values()], dtype=np.int32),  # Start positions
+            path_end=np.array([index[p.end_id] for p in self._path_map.values()], dtype=np.int32),  # End positions
+            path_distance=np.array([p.distance for p in self._path_map.values()], dtype=np.float64),  # Distances
+            path_type=np.array([p.path_type for p in self._path_map.values()], dtype=str),  # Path types
+            path_accessible=np.array([p.is_accessible for p in self._path_map.values()], dtype=np.bool_),  # Accessibility flags
+        )
+
+    @classmethod
+    def load_from_npz(cls, filepath: PathLib) -> 'CampusData':
+        """Load campus data from an archive written by save_to_npz."""
+        campus_data = cls()  # Create a new instance of CampusData
+        with np.load(filepath) as data:  # Plain string and number arrays, no pickling
+            ids = [sys.intern(loc_id) for loc_id in data["ids"].tolist()]  # Interned location IDs, shared by every reference
+            conn_ptr = data["conn_ptr"].tolist()  # CSR offsets
+            conn_ids = data["conn_ids"].tolist()  # Connected positions
+            campus_data.bulk_load(
+                (Location(id=loc_id, name=name, x=x, y=y, type=loc_type, full_name=full_name,
+                          is_accessible=accessible, is_waypoint=waypoint,
+                          connections={ids[j] for j in conn_ids[conn_ptr[i]:conn_ptr[i + 1]]})
+                 for i, (loc_id, name, full_name, loc_type, (x, y), accessible, waypoint) in enumerate(zip(
+                     ids, data["names"].tolist(), data["full_names"].tolist(), data["types"].tolist(),
+                     data["xy"].tolist(), data["loc_accessible"].tolist(), data["loc_waypoint"].tolist()))),
+                (Path(start_id=ids[s], end_id=ids[e], distance=d, path_type=t, is_accessible=a)
+                 for s, e, d, t, a in zip(data["path_start"].tolist(), data["path_end"].tolist(),
+                                          data["path_distance"].tolist(), data["path_type"].tolist(),
+                                          data["path_accessible"].tolist()))
+            )  # Locations and paths in saved order
+
+        logger.debug("Loaded %d locations and %d paths from %s",
+                     len(campus_data.locations), len(campus_data.paths), filepath)  # Counts of loaded data
+
+        return campus_data  # Return the populated CampusData instance
 
     @classmethod
-    def load_from_json(cls, filepath: Path) -> 'CampusData':
+    def load_from_json(cls, filepath: PathLib) -> 'CampusData':
         """Load campus data from a JSON file."""
         campus_data = cls()  # Create a new instance of CampusData
-        print("\nLoading JSON data:")  # Debug message for loading data
-        
-        # Open and read the JSON file
-        with open(filepath, 'r') as f:
-            data = json.load(f)  # Load JSON data
-            print(f"Raw JSON data: {data.keys()}")  # Print keys of the loaded data
         
-        # Load locations from the JSON data
-        print("\nLoading locations:")
-        for loc_data in data.get("locations", []):
-            location = Location(**loc_data)  # Create a Location instance from the data
-            campus_data.add_location(location)  # Add the location to campus data
-            print(f"Loaded location: {location.id}")  # Debug message for loaded location
+        # Read and parse the JSON file in one go
+        raw = PathLib(filepath).read_bytes()  # Read raw bytes from disk
+        data = orjson.loads(raw) if orjson else json.loads(raw)  # Parse with orjson when available
         
-        # Load paths from the JSON data
-        print("\nLoading paths:")
-        for path_data in data.get("paths", []):
-            path = Path(**path_data)  # Create a Path instance from the data
-            campus_data.add_path(path)  # Add the path to campus data
-            print(f"Loaded path: {path.start_id} -> {path.end_id}")  # Debug message for loaded path
+        # Build locations and paths in single passes, interning IDs so equal IDs share one string object
+        intern = sys.intern  # Bind once for the comprehensions
+        campus_data.bulk_load(
+            (Location(**{**loc_data, "id": intern(loc_data["id"]),
+                         "connections": set(map(intern, loc_data.get("connections") or ()))})  # Connections as a set
+             for loc_data in data.get("locations", [])),
+            (Path(**{**path_data, "start_id": intern(path_data["start_id"]), "end_id": intern(path_data["end_id"])})
+             for path_data in data.get("paths", []))
+        )  # Locations and paths in file order
         
-        # Print summary of loaded data
-        print(f"\nTotal locations loaded: {len(campus_data.locations)}")  # Count of loaded locations
-        print(f"Total paths loaded: {len(campus_data.paths)}")  # Count of loaded paths
+        # Log summary of loaded data
+        logger.debug("Loaded %d locations and %d paths from %s",
+                     len(campus_data.locations), len(campus_data.paths), filepath)  # Counts of loaded data
         
         return campus_data  # Return the populated CampusData instance
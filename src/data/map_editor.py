@@ -1,8 +1,56 @@
-import pygame  # Import the pygame library for graphics and game development
+import logging  # Import logging for debug messages
+import math  # Import math for C-level distance helpers
+import sys  # Import sys for string interning
+import numpy as np  # Import NumPy for coordinate arrays
 
 from pathlib import Path as PathLib  # Import Path for handling file paths
-from typing import Tuple, Optional  # Import Tuple and Optional for type hinting
+from typing import Dict, Iterable, Optional, Set, Tuple  # Import typing helpers for type hinting
 from .campus_data import Location, Path, CampusData  # Import necessary classes from campus_data module
+from .spatial_index import KDTree, SegmentGrid, UniformGrid  # Import the spatial indexes used for hit-tests
+
+logger = logging.getLogger(__name__)  # Module-level logger
+
+try:
+    from numba import njit  # Optional JIT compiler for the scalar geometry kernels
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as plain Python."""
+        return lambda func: func
+
+@njit(cache=True, fastmath=True)
+def _euclid(dx: float, dy: float) -> float:
+    """Length of the vector (dx, dy)."""
+    return math.hypot(dx, dy)
+
+@njit(cache=True, fastmath=True)
+def _nearest_segment(px: float, py: float, rows: np.ndarray, starts: np.ndarray, d: np.ndarray,
+                     inv_len_sq: np.ndarray, max_distance_sq: float) -> int:
+    """Row of the segment nearest to (px, py) among `rows`, or -1 if none is strictly within range.
+
+    Args:
+        px, py: The point to test
+        rows: Candidate segment rows, in the order ties should be broken
+        starts: (N, 2) segment start points
+        d: (N, 2) segment direction vectors
+        inv_len_sq: Reciprocal squared segment lengths, 0 for degenerate segments
+        max_distance_sq: Squared search radius
+    """
+    best = -1  # Nearest row found so far
+    best_sq = max_distance_sq  # Squared search radius, shrinks as segments are found
+    for k in range(len(rows)):
+        i = rows[k]
+        x1 = starts[i, 0]
+        y1 = starts[i, 1]
+        dx = d[i, 0]
+        dy = d[i, 1]
+        t = max(0.0, min(1.0, ((px - x1) * dx + (py - y1) * dy) * inv_len_sq[i]))  # Clipped projection parameter
+        ox = x1 + t * dx - px  # X offset to the nearest segment point
+        oy = y1 + t * dy - py  # Y offset to the nearest segment point
+        dist_sq = ox * ox + oy * oy
+        if dist_sq < best_sq:  # Closer than anything seen so far
+            best_sq = dist_sq
+            best = i
+    return best
 
 class MapEditor:
     def __init__(self):
@@ -14,28 +62,49 @@ class MapEditor:
         self.is_accessible = False  # Flag to indicate if the edge is accessible
         self.delete_mode = False  # Flag to indicate if delete mode is active
         self.edge_click_threshold = 0.02  # Threshold for edge detection (distance)
+        self._node_click_threshold_sq = 0.02 ** 2  # Squared threshold for clicking near a node
+        self._edge_click_threshold_sq = self.edge_click_threshold ** 2  # Squared threshold for edge detection
+        self._node_grid = UniformGrid(2 * max(self.edge_click_threshold, 0.02))  # Spatial hash of node positions
+        self._edge_grid = SegmentGrid(self._node_grid.cell_size)  # Spatial hash of edge segments
+        self._grid_max_nodes = 500  # Above this many nodes the k-d tree answers hit-tests instead
         self.pending_node = None  # Variable to store information about a node being created
         self.scale_factor = 750  # Scale factor for converting normalized coordinates to meters
         self.edit_mode = True  # Flag to indicate if the editor is in edit mode
+        self._data_dir = PathLib(__file__).resolve().parents[2] / "data"  # Map directory, resolved once
+        self._next_waypoint_id = 0  # Number for the next waypoint_N ID
+        self._next_building_id = 0  # Number for the next node_N ID
+        self._kdtree = None  # Lazily built k-d tree over node coordinates
+        self._kdtree_ids = None  # Location IDs parallel to the k-d tree rows
+        self._kdtree_due = False  # Set after one scan since an edit; the next query builds the tree
+        self._edge_starts = None  # Lazily built (E, 2) array of edge start coordinates
+        self._edge_pairs = None  # Edge endpoint IDs parallel to the edge arrays
+        self._edge_rows = None  # Edge endpoint IDs -> row in the edge arrays
+        self._edge_d = None  # (E, 2) array of segment direction vectors
+        self._edge_inv_len_sq = None  # 1 / squared segment length (0 for zero-length segments)
+        self._pending_edge_adds: Dict[Tuple[str, str], None] = {}  # Edges created since the arrays were synced, in order
+        self._pending_edge_removes: Set[Tuple[str, str]] = set()  # Edges deleted since the arrays were synced
+        self.map_version = 0  # Bumped on every node or edge change so views can tell when cached geometry is stale
+        self._last_hit_pos = None  # Position of the most recent hit-test
+        self._last_hit_node = None  # Node found at that position
+        self._last_hit_edge = None  # Edge found at that position (Ellipsis until computed)
 
-    def handle_click(self, pos: Tuple[int, int], normalized_pos: Tuple[float, float], shift_held: bool, alt_held: bool) -> None:
-        """Handle mouse clicks for node/edge creation/deletion"""
-        clicked_node = self._find_node_at_position(normalized_pos)  # Find if a node was clicked at the normalized position
+    def handle_click(self, pos: Tuple[int, int], normalized_pos: Tuple[float, float], button: int, shift_held: bool, alt_held: bool) -> None:
+        """Handle mouse clicks for node/edge creation/deletion; button is the pygame event's button number"""
+        if button not in (1, 3):  # Only left and right clicks edit the map
+            return
 
         if shift_held:  # Check if the shift key is held for delete mode
-            if pygame.mouse.get_pressed()[2]:  # Check for right mouse button click
+            if button == 3:  # Check for right mouse button click
+                clicked_node, clicked_edge = self._pick(normalized_pos)  # Node under the click, else the edge under it
                 if clicked_node:  # If a node was clicked
                     self._remove_node(clicked_node)  # Remove the clicked node
-                    print(f"Removed node: {clicked_node}")  # Debug message for node removal
+                    logger.debug("Removed node: %s", clicked_node)  # Debug message for node removal
                     self._reset_edge_drawing()  # Reset edge drawing state
-                else:
-                    # Check if clicked on an edge
-                    clicked_edge = self._find_edge_at_position(normalized_pos)  # Find if an edge was clicked
-                    if clicked_edge:  # If an edge was clicked
-                        self._remove_edge(clicked_edge)  # Remove the clicked edge
-                        print(f"Removed edge between {clicked_edge[0]} and {clicked_edge[1]}")  # Debug message for edge removal
+                elif clicked_edge:  # If an edge was clicked
+                    self._remove_edge(clicked_edge)  # Remove the clicked edge
+                    logger.debug("Removed edge between %s and %s", clicked_edge[0], clicked_edge[1])  # Debug message for edge removal
         else:  # Normal mode
-            if pygame.mouse.get_pressed()[0]:  # Check for left mouse button click
+            if button == 1:  # Check for left mouse button click
                 if not self.drawing_edge:  # If not currently drawing an edge
                     if alt_held:  # Check if the alt key is held
                         # Create waypoint directly without name input
@@ -44,17 +113,13 @@ class MapEditor:
                         # Create building node (will trigger name input)
                         self._handle_node_creation(normalized_pos)  # Handle creation of a new building node
             
-            elif pygame.mouse.get_pressed()[2]:  # Check for right mouse button click
-                self._handle_edge_creation(clicked_node)  # Handle edge creation logic
+            elif button == 3:  # Check for right mouse button click
+                self._handle_edge_creation(self._hit_node(normalized_pos))  # Handle edge creation logic
 
     def _create_waypoint(self, normalized_pos: Tuple[float, float]) -> None:
         """Create an unnamed waypoint node"""
-        # Find the next available waypoint number
-        existing_waypoints = [int(loc_id.split('_')[1]) for loc_id in self.campus_data.locations.keys() 
-                             if loc_id.startswith('waypoint_')]  # List existing waypoints
-        next_number = max(existing_waypoints, default=-1) + 1  # Determine the next waypoint number
-        
-        node_id = f"waypoint_{next_number}"  # Create a unique ID for the new waypoint
+        node_id = sys.intern(f"waypoint_{self._next_waypoint_id}")  # Create a unique, interned ID for the new waypoint
+        self._next_waypoint_id += 1  # Never hand out the same number twice
         new_location = Location(
             id=node_id,  # Set the ID for the new location
             name="",  # Empty name for waypoints
@@ -65,11 +130,13 @@ class MapEditor:
             is_accessible=self.is_accessible  # Set accessibility based on the current state
         )
         self.campus_data.add_location(new_location)  # Add the new location to campus data
-        print(f"Created waypoint: {node_id}")  # Debug message for waypoint creation
+        self._node_grid.insert(node_id, new_location.x, new_location.y)  # File the node in its grid cell
+        self._nodes_changed()  # Node index is stale
+        logger.debug("Created waypoint: %s", node_id)  # Debug message for waypoint creation
 
     def _handle_node_creation(self, normalized_pos: Tuple[float, float], screen_pos: Tuple[int, int]) -> None:
         """Handle creation of new building nodes"""
-        node_id = f"node_{len(self.campus_data.locations)}"  # Create a unique ID for the new node
+        node_id = sys.intern(f"node_{self._next_building_id}")  # Create a unique, interned ID for the new node
         self.pending_node = {
             'id': node_id,  # Store the ID of the pending node
             'pos': normalized_pos,  # Store the normalized position of the pending node
@@ -90,7 +157,10 @@ class MapEditor:
                 is_waypoint=False  # Set is_waypoint flag to False
             )
             self.campus_data.add_location(new_location)  # Add the new location to campus data
-            print(f"Created building node: {name} ({self.pending_node['id']})")  # Debug message for building node creation
+            self._node_grid.insert(new_location.id, new_location.x, new_location.y)  # File the node in its grid cell
+            self._next_building_id += 1  # The pending ID is now taken
+            self._nodes_changed()  # Node index is stale
+            logger.debug("Created building node: %s (%s)", name, self.pending_node['id'])  # Debug message for building node creation
             self.pending_node = None  # Reset pending node after creation
 
     def _handle_edge_creation(self, clicked_node: Optional[str]) -> None:
@@ -100,45 +170,31 @@ class MapEditor:
                 # Start drawing edge from clicked node
                 self.edge_start = clicked_node  # Set the starting node for the edge
                 self.drawing_edge = True  # Set the drawing edge flag to True
-                print(f"Starting edge from: {clicked_node}")  # Debug message for starting edge
+                logger.debug("Starting edge from: %s", clicked_node)  # Debug message for starting edge
         else:
-            if clicked_node:  # If a node was clicked while drawing an edge
-                # Trying to complete edge
-                if clicked_node == self.edge_start:  # Check if clicked the same node
-                    print("Cannot create edge to same node")  # Debug message for invalid edge creation
-                    self._reset_edge_drawing()  # Reset edge drawing state
-                elif self._edge_exists(self.edge_start, clicked_node):  # Check if edge already exists
-                    print("Edge already exists")  # Debug message for existing edge
-                    self._reset_edge_drawing()  # Reset edge drawing state
-                else:
-                    self._create_edge(self.edge_start, clicked_node)  # Create the edge
-                    print(f"Created edge: {self.edge_start} -> {clicked_node}")  # Debug message for edge creation
-                    self._reset_edge_drawing()  # Reset edge drawing state
+            # Every click while drawing finishes the attempt one way or another
+            if not clicked_node:  # Clicked empty space, cancel edge creation
+                logger.debug("Edge creation cancelled")  # Debug message for cancelled edge creation
+            elif clicked_node == self.edge_start:  # Check if clicked the same node
+                logger.debug("Cannot create edge to same node")  # Debug message for invalid edge creation
+            elif clicked_node in self.campus_data.neighbors(self.edge_start):  # Single adjacency lookup for duplicates
+                logger.debug("Edge already exists")  # Debug message for existing edge
             else:
-                # Clicked empty space, cancel edge creation
-                print("Edge creation cancelled")  # Debug message for cancelled edge creation
-                self._reset_edge_drawing()  # Reset edge drawing state
+                self._create_edge(self.edge_start, clicked_node)  # Create the edge (logs the result)
+            self._reset_edge_drawing()  # Reset edge drawing state
 
     def _reset_edge_drawing(self) -> None:
         """Reset edge drawing state"""
         self.drawing_edge = False  # Set drawing edge flag to False
         self.edge_start = None  # Clear the starting node for edge drawing
 
-    def _edge_exists(self, start_id: str, end_id: str) -> bool:
-        """Check if an edge already exists between two nodes"""
-        for path in self.campus_data.paths:  # Iterate through existing paths
-            if (path.start_id == start_id and path.end_id == end_id) or \
-               (path.start_id == end_id and path.end_id == start_id):  # Check for both directions
-                return True  # Return True if edge exists
-        return False  # Return False if edge does not exist
-
     def _calculate_distance(self, start_pos: Tuple[float, float], end_pos: Tuple[float, float]) -> float:
         """Calculate the Euclidean distance between two points and convert to meters"""
         dx = (end_pos[0] - start_pos[0]) * self.scale_factor  # Calculate x distance
         dy = (end_pos[1] - start_pos[1]) * self.scale_factor  # Calculate y distance
         # Convert normalized coordinates to approximate real-world meters
         # Assuming the map represents roughly a 1km x 1km area
-        return round(((dx ** 2 + dy ** 2) ** 0.5), 1)  # Round to 1 decimal place
+        return round(_euclid(float(dx), float(dy)), 1)  # Round to 1 decimal place
 
     def _create_edge(self, start_id: str, end_id: str) -> None:
         """Create a new edge between two nodes with calculated distance"""
@@ -160,41 +216,138 @@ class MapEditor:
                 path_type="walkway",  # Specify path type
                 is_accessible=self.is_accessible  # Set accessibility based on current state
             )
+            replaced = self.campus_data.neighbors(start_id).get(end_id)  # Existing path between the pair, if any
             self.campus_data.add_path(new_path)  # Add the new path to campus data
+            if replaced:  # Replaced in place: unfile the old segment and regather the arrays in path order
+                self._edge_grid.remove((replaced.start_id, replaced.end_id))
+                self._edges_changed()
+            else:  # New pair: append it to the edge arrays on the next hit-test
+                self._edges_edited(added=((start_id, end_id),))
+            self._edge_grid.insert((start_id, end_id), start_loc.x, start_loc.y, end_loc.x, end_loc.y)  # File the segment
             
             # Update connections in both locations
-            if end_id not in start_loc.connections:  # Check if connection does not exist
-                start_loc.connections.append(end_id)  # Add connection to start location
-            if start_id not in end_loc.connections:  # Check if connection does not exist
-                end_loc.connections.append(start_id)  # Add connection to end location
+            start_loc.connections.add(end_id)  # Add connection to start location
+            end_loc.connections.add(start_id)  # Add connection to end location
             
-            print(f"Created edge: {start_id} -> {end_id} (Distance: {distance:.1f}m)")  # Debug message for edge creation
+            logger.debug("Created edge: %s -> %s (Distance: %.1fm)", start_id, end_id, distance)  # Debug message for edge creation
 
     def _remove_node(self, node_id: str) -> None:
         """Remove a node and all its connected edges"""
         if node_id in self.campus_data.locations:  # Check if the node exists
-            # Remove all paths connected to this node
-            self.campus_data.paths = [
-                path for path in self.campus_data.paths 
-                if path.start_id != node_id and path.end_id != node_id  # Filter out paths connected to the node
-            ]
-            
-            # Remove node from other nodes' connections
-            for location in self.campus_data.locations.values():  # Iterate through all locations
-                if node_id in location.connections:  # Check if the node is in connections
-                    location.connections.remove(node_id)  # Remove the node from connections
-            
-            # Remove the node itself
-            del self.campus_data.locations[node_id]  # Delete the node from campus data
+            location = self.campus_data.locations[node_id]  # Node being removed
+            self._node_grid.remove(node_id, location.x, location.y)  # Take it out of its grid cell
+            removed = [(path.start_id, path.end_id) for path in self.campus_data.neighbors(node_id).values()]  # Edges about to disappear with the node
+            for pair in removed:
+                self._edge_grid.remove(pair)
+            self.campus_data.remove_location(node_id)  # Drops its paths and scrubs its neighbors' connections
+            self._nodes_changed()  # Node index is stale
+            self._edges_edited(removed=removed)  # Drop its edges from the arrays on the next hit-test
+
+    def _nodes_changed(self) -> None:
+        """Drop cached node lookups after nodes are added or removed"""
+        self._kdtree = None  # Rebuild the k-d tree once edits settle
+        self._kdtree_due = False  # Scan first instead of rebuilding right away
+        self._last_hit_pos = None  # Forget the memoized hit-test
+        self.map_version += 1  # Cached node geometry is stale
+
+    def _edges_changed(self) -> None:
+        """Drop cached edge lookups after the paths were replaced wholesale"""
+        self._edge_starts = None  # Regather the edge arrays on next use
+        self._pending_edge_adds.clear()  # The regather covers any queued edits
+        self._pending_edge_removes.clear()
+        self._last_hit_pos = None  # Forget the memoized hit-test
+        self.map_version += 1  # Cached edge geometry is stale
+
+    def _edges_edited(self, added: Iterable[Tuple[str, str]] = (), removed: Iterable[Tuple[str, str]] = ()) -> None:
+        """Queue individual edge additions and removals for the next hit-test to apply in one batch"""
+        self._last_hit_pos = None  # Forget the memoized hit-test
+        self.map_version += 1  # Cached edge geometry is stale
+        if self._edge_starts is None:  # Arrays not built yet; the first hit-test gathers everything
+            return
+        for pair in removed:
+            if pair in self._pending_edge_adds:  # Created and deleted between hit-tests: never reaches the arrays
+                del self._pending_edge_adds[pair]
+            else:
+                self._pending_edge_removes.add(pair)
+        for pair in added:
+            self._pending_edge_adds[pair] = None  # Appended after existing rows, matching path order
+
+    def _segment_arrays(self, pairs) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Start points, direction vectors and reciprocal squared lengths for the given edge pairs"""
+        rows = self.campus_data.loc_rows  # Location ID -> coordinate row
+        n = len(pairs)  # Number of edges
+        xy = self.campus_data.loc_xy  # Location coordinates
+        starts = xy[np.fromiter((rows[a] for a, _ in pairs), np.intp, n)]  # Segment start points
+        d = xy[np.fromiter((rows[b] for _, b in pairs), np.intp, n)] - starts  # Segment direction vectors
+        length_sq = np.einsum('ij,ij->i', d, d)  # Squared segment lengths
+        inv_len_sq = np.divide(1.0, length_sq, out=np.zeros_like(length_sq), where=length_sq > 0)  # Hoisted reciprocal
+        return starts, d, inv_len_sq
+
+    def _sync_edge_arrays(self) -> None:
+        """Bring the edge arrays up to date, gathering from scratch or applying the queued edits"""
+        if self._edge_starts is None:  # First use since a load: gather every edge
+            self._edge_pairs = [(path.start_id, path.end_id) for path in self.campus_data.paths]  # Row -> edge IDs
+            self._edge_starts, self._edge_d, self._edge_inv_len_sq = self._segment_arrays(self._edge_pairs)
+            self._edge_rows = {pair: i for i, pair in enumerate(self._edge_pairs)}  # Edge IDs -> row
+            return
+        if self._pending_edge_removes:  # Drop deleted rows, keeping the rest in order
+            removes = self._pending_edge_removes
+            keep = np.fromiter((pair not in removes for pair in self._edge_pairs), np.bool_, len(self._edge_pairs))
+            self._edge_pairs = [pair for pair in self._edge_pairs if pair not in removes]
+            self._edge_starts = self._edge_starts[keep]
+            self._edge_d = self._edge_d[keep]
+            self._edge_inv_len_sq = self._edge_inv_len_sq[keep]
+            self._edge_rows = {pair: i for i, pair in enumerate(self._edge_pairs)}  # Rows shifted down
+            removes.clear()
+        if self._pending_edge_adds:  # Append new rows in one concatenation
+            added = list(self._pending_edge_adds)
+            starts, d, inv_len_sq = self._segment_arrays(added)
+            first = len(self._edge_pairs)  # Row of the first new edge
+            self._edge_rows.update((pair, first + i) for i, pair in enumerate(added))
+            self._edge_pairs.extend(added)
+            self._edge_starts = np.concatenate((self._edge_starts, starts))
+            self._edge_d = np.concatenate((self._edge_d, d))
+            self._edge_inv_len_sq = np.concatenate((self._edge_inv_len_sq, inv_len_sq))
+            self._pending_edge_adds.clear()
+
+    def _hit_node(self, normalized_pos: Tuple[float, float]) -> Optional[str]:
+        """Node under the position, reusing the previous result for a repeated position"""
+        if normalized_pos != self._last_hit_pos:  # New position: start a fresh memo entry
+            self._last_hit_pos = normalized_pos
+            self._last_hit_node = self._find_node_at_position(normalized_pos)
+            self._last_hit_edge = ...  # Edge is computed only when asked for
+        return self._last_hit_node
+
+    def _pick(self, normalized_pos: Tuple[float, float]) -> Tuple[Optional[str], Optional[Tuple[str, str]]]:
+        """Node and edge under the position in one call; nodes take priority, so the edge is only tested on a node miss"""
+        node = self._hit_node(normalized_pos)  # Node test, memoized by position
+        if node is not None:  # A node wins outright
+            return node, None
+        if self._last_hit_edge is ...:  # Edge not computed for this position yet
+            self._last_hit_edge = self._find_edge_at_position(normalized_pos)
+        return None, self._last_hit_edge
 
     def _find_node_at_position(self, normalized_pos: Tuple[float, float]) -> Optional[str]:
         """Find if there's a node at the given position"""
-        for loc_id, location in self.campus_data.locations.items():  # Iterate through all locations
-            distance = ((normalized_pos[0] - location.x) ** 2 + 
-                       (normalized_pos[1] - location.y) ** 2) ** 0.5  # Calculate distance to the node
-            if distance < 0.02:  # Threshold for clicking near a node
-                return loc_id  # Return the ID of the clicked node
-        return None  # Return None if no node was found
+        if len(self.campus_data.locations) < self._grid_max_nodes:  # Small maps: grid cells beat tree descent
+            return self._node_grid.query(normalized_pos, self._node_click_threshold_sq)
+        if self._kdtree is None and not self._kdtree_due:  # First query since an edit
+            self._kdtree_due = True  # Build the tree if the next query finds the map unchanged
+            return self._scan_nodes(normalized_pos)  # One vectorized pass is cheaper than a rebuild
+        if self._kdtree is None:  # Map was stable between two queries: index it
+            self._kdtree_ids = list(self.campus_data.loc_row_ids)  # Row -> location ID
+            self._kdtree = KDTree(self.campus_data.loc_xy)  # Index the coordinate rows
+        row = self._kdtree.query(normalized_pos, self._node_click_threshold_sq)  # Nearest node within the click threshold
+        return self._kdtree_ids[row] if row >= 0 else None  # Return the ID of the clicked node, or None
+
+    def _scan_nodes(self, normalized_pos: Tuple[float, float]) -> Optional[str]:
+        """Find the nearest node by scanning the coordinate buffer in one NumPy pass"""
+        offset = self.campus_data.loc_xy - normalized_pos  # Offsets to every row; free rows stay infinite
+        dist_sq = np.einsum('ij,ij->i', offset, offset)  # Squared distances, no square root
+        if not len(dist_sq):  # Empty map
+            return None
+        row = int(dist_sq.argmin())  # Closest row
+        return self.campus_data.loc_row_ids[row] if dist_sq[row] < self._node_click_threshold_sq else None
 
     def get_current_edge_drawing(self) -> Optional[Tuple[Tuple[float, float], Tuple[float, float]]]:
         """Get the coordinates of the edge currently being drawn"""
@@ -204,82 +357,78 @@ class MapEditor:
         return None  # Return None if no edge is being drawn
 
     def save_map(self) -> None:
-        """Save the current map to JSON"""
-        data_dir = PathLib(__file__).parent.parent.parent / "data"  # Define the data directory path
+        """Save the current map to JSON, plus a binary copy for fast loading"""
+        data_dir = self._data_dir  # Cached data directory path
         data_dir.mkdir(exist_ok=True)  # Create the directory if it does not exist
         
         self.campus_data.save_to_json(data_dir / "locations.json")  # Save campus data to JSON file
-        print("Map saved successfully!")  # Debug message for successful save
+        self.campus_data.save_to_npz(data_dir / "locations.npz")  # Binary copy, written after the JSON
+        logger.info("Map saved successfully!")  # Log successful save
 
     def load_map(self) -> bool:
-        """Load map from JSON"""
-        data_dir = PathLib(__file__).parent.parent.parent / "data"  # Define the data directory path
+        """Load map from the binary copy when it is current, otherwise from JSON"""
+        data_dir = self._data_dir  # Cached data directory path
         json_path = data_dir / "locations.json"  # Define the path to the JSON file
+        npz_path = data_dir / "locations.npz"  # Define the path to the binary copy
         
-        if json_path.exists():  # Check if the JSON file exists
+        if npz_path.exists() and (not json_path.exists() or
+                                  npz_path.stat().st_mtime >= json_path.stat().st_mtime):  # JSON not edited since
+            self.campus_data = CampusData.load_from_npz(npz_path)  # Load campus data from the archive
+        elif json_path.exists():  # Check if the JSON file exists
             self.campus_data = CampusData.load_from_json(json_path)  # Load campus data from JSON file
-            print(f"Map loaded with {len(self.campus_data.locations)} locations and {len(self.campus_data.paths)} paths")  # Debug message for loaded map
-            return True  # Return True if loading was successful
-        return False  # Return False if loading failed
+        else:
+            return False  # Return False if loading failed
+        self.campus_data.recompute_all_distances(self.scale_factor)  # Keep distances in step with coordinates
+        self._node_grid = UniformGrid(self._node_grid.cell_size)  # Refile every loaded node
+        self._node_grid.bulk_insert(self.campus_data.loc_row_ids, self.campus_data.loc_xy)  # Rows are dense right after a load
+        self._edge_grid = SegmentGrid(self._edge_grid.cell_size)  # Refile every loaded edge
+        locations = self.campus_data.locations
+        for path in self.campus_data.paths:
+            start_loc, end_loc = locations[path.start_id], locations[path.end_id]
+            self._edge_grid.insert((path.start_id, path.end_id), start_loc.x, start_loc.y, end_loc.x, end_loc.y)
+        self._nodes_changed()  # Node index belongs to the old data
+        self._edges_changed()  # Edge arrays belong to the old data
+        self._sync_id_counters()  # Continue numbering after the loaded IDs
+        logger.info("Map loaded with %d locations and %d paths", len(self.campus_data.locations), len(self.campus_data.paths))  # Log loaded map
+        return True  # Return True if loading was successful
+
+    def _sync_id_counters(self) -> None:
+        """Set the waypoint and building ID counters past the highest loaded IDs"""
+        def next_number(prefix: str) -> int:
+            return 1 + max((int(loc_id[len(prefix):]) for loc_id in self.campus_data.locations
+                            if loc_id.startswith(prefix) and loc_id[len(prefix):].isdigit()),
+                           default=-1)  # One past the highest existing number; hand-named IDs are skipped
+        self._next_waypoint_id = next_number("waypoint_")  # Next waypoint_N
+        self._next_building_id = next_number("node_")  # Next node_N
 
     def _find_edge_at_position(self, pos: Tuple[float, float]) -> Optional[Tuple[str, str]]:
         """Find if there's an edge at the given position"""
-        for path in self.campus_data.paths:  # Iterate through all paths
-            start_loc = self.campus_data.locations[path.start_id]  # Get starting location
-            end_loc = self.campus_data.locations[path.end_id]  # Get ending location
-            
-            # Calculate distance from point to line segment
-            distance = self._point_to_line_distance(
-                pos,  # Point to check
-                (start_loc.x, start_loc.y),  # Start of the line segment
-                (end_loc.x, end_loc.y)  # End of the line segment
-            )
-            
-            if distance < self.edge_click_threshold:  # Check if the distance is within the threshold
-                return (path.start_id, path.end_id)  # Return the IDs of the edge
+        candidates = self._edge_grid.candidates(pos)  # Edges filed in the 3x3 cells around the click
+        if not candidates:  # Nothing nearby
+            return None
+        if self._edge_starts is None or self._pending_edge_adds or self._pending_edge_removes:  # Edits since the last hit-test
+            self._sync_edge_arrays()
+        rows = np.sort(np.fromiter((self._edge_rows[pair] for pair in candidates), np.intp, len(candidates)))  # Candidate rows in path order
+        i = _nearest_segment(float(pos[0]), float(pos[1]), rows, self._edge_starts, self._edge_d,
+                             self._edge_inv_len_sq, self._edge_click_threshold_sq)  # Closest candidate within the threshold
+        if i >= 0:  # An edge is close enough
+            return self._edge_pairs[i]  # Return the IDs of the edge
         return None  # Return None if no edge was found
 
-    def _point_to_line_distance(self, point: Tuple[float, float], 
-                              line_start: Tuple[float, float], 
-                              line_end: Tuple[float, float]) -> float:
-        """Calculate the distance from a point to a line segment"""
-        x, y = point  # Unpack point coordinates
-        x1, y1 = line_start  # Unpack line start coordinates
-        x2, y2 = line_end  # Unpack line end coordinates
-        
-        # Calculate the length of the line segment
-        line_length = ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5  # Calculate line length
-        
-        if line_length == 0:  # Check for degenerate case where line length is zero
-            return ((x - x1) ** 2 + (y - y1) ** 2) ** 0.5  # Return distance to the start point
-            
-        # Calculate the distance from point to line
-        t = max(0, min(1, ((x - x1) * (x2 - x1) + (y - y1) * (y2 - y1)) / (line_length ** 2)))  # Project point onto line segment
-        
-        # Find the nearest point on the line segment
-        proj_x = x1 + t * (x2 - x1)  # Calculate projected x coordinate
-        proj_y = y1 + t * (y2 - y1)  # Calculate projected y coordinate
-        
-        # Calculate the distance from the point to the nearest point on the line
-        return ((x - proj_x) ** 2 + (y - proj_y) ** 2) ** 0.5  # Return the calculated distance
-
     def _remove_edge(self, edge: Tuple[str, str]) -> None:
         """Remove an edge and update connections"""
         start_id, end_id = edge  # Unpack edge IDs
         
         # Remove the path
-        self.campus_data.paths = [
-            path for path in self.campus_data.paths 
-            if not ((path.start_id == start_id and path.end_id == end_id) or 
-                   (path.start_id == end_id and path.end_id == start_id))  # Filter out the edge to be removed
-        ]
+        path = self.campus_data.remove_path(start_id, end_id)  # Drop it from the path list and adjacency map
+        if path:  # Unfile the segment under its stored orientation
+            self._edge_grid.remove((path.start_id, path.end_id))
+            self._edges_edited(removed=((path.start_id, path.end_id),))  # Drop it from the arrays on the next hit-test
         
         # Update connections in both locations
         if start_id in self.campus_data.locations and end_id in self.campus_data.locations:  # Check if both locations exist
             start_loc = self.campus_data.locations[start_id]  # Get starting location
             end_loc = self.campus_data.locations[end_id]  # Get ending location
             
-            if end_id in start_loc.connections:  # Check if the end ID is in the start location's connections
-                start_loc.connections.remove(end_id)  # Remove the connection
-            if start_id in end_loc.connections:  # Check if the start ID is in the end location's connections
-                end_loc.connections.remove(start_id)  # Remove the connection
\ No newline at end of file
+            start_loc.connections.discard(end_id)  # Remove the connection
+            end_loc.connections.discard(start_id)  # Remove the connection
\ No newline at end of file
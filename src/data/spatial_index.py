@@ -0,0 +1,222 @@
+import math  # Import math for floor division of coordinates
+import numpy as np  # Import NumPy for coordinate arrays
+from typing import Dict, Hashable, List, Optional, Set, Tuple  # Import typing helpers for type hinting
+
+class KDTree:
+    """Static 2-D k-d tree over normalized map coordinates."""
+
+    __slots__ = ('_xs', '_ys', '_rows')
+
+    def __init__(self, points: np.ndarray):
+        """Build the tree from an (N, 2) array of x/y coordinates.
+
+        Args:
+            points: Coordinates of the indexed points
+
+        The tree is stored implicitly: each [lo, hi) slice of the point order
+        has its splitting point at the middle, split on x at even depths and
+        on y at odd depths.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)  # Normalize the input shape
+        order = np.arange(len(points))  # Permutation of point indices in tree order
+        stack = [(0, len(points), 0)]  # Slices still to be partitioned
+        while stack:
+            lo, hi, axis = stack.pop()  # Next slice and its splitting axis
+            if hi - lo <= 1:  # Leaves need no partitioning
+                continue
+            mid = (lo + hi) // 2  # Median position of the slice
+            seg = order[lo:hi]  # Point indices in this slice
+            order[lo:hi] = seg[np.argpartition(points[seg, axis], mid - lo)]  # Median split along the axis
+            stack.append((lo, mid, 1 - axis))  # Left subtree
+            stack.append((mid + 1, hi, 1 - axis))  # Right subtree
+        self._xs = points[order, 0].tolist()  # X coordinates in tree order
+        self._ys = points[order, 1].tolist()  # Y coordinates in tree order
+        self._rows = order.tolist()  # Original point indices in tree order
+
+    def __len__(self) -> int:
+        return len(self._rows)  # Number of indexed points
+
+    def query(self, point: Tuple[float, float], max_distance_sq: float) -> int:
+        """Find the indexed point nearest to `point`.
+
+        Args:
+            point: The x/y coordinates to search around
+            max_distance_sq: Only points whose squared distance is strictly below this are considered
+
+        Returns:
+            The original index of the nearest point, or -1 if none is in range
+        """
+        px, py = point  # Unpack the query point
+        xs, ys, rows = self._xs, self._ys, self._rows  # Bind tree arrays locally
+        best = -1  # Nearest point found so far
+        best_sq = max_distance_sq  # Squared search radius, shrinks as points are found
+        stack = [(0, len(rows), 0)]  # Subtrees still to visit
+        while stack:
+            lo, hi, axis = stack.pop()  # Next subtree and its splitting axis
+            if lo >= hi:  # Empty subtree
+                continue
+            mid = (lo + hi) // 2  # Splitting point of the subtree
+            dx = px - xs[mid]  # X offset to the splitting point
+            dy = py - ys[mid]  # Y offset to the splitting point
+            dist_sq = dx * dx + dy * dy  # Squared distance to the splitting point
+            if dist_sq < best_sq:  # Closer than anything seen so far
+                best_sq = dist_sq
+                best = rows[mid]
+            diff = dx if axis == 0 else dy  # Signed offset across the splitting plane
+            if diff < 0:  # Query lies on the low side
+                near, far = (lo, mid), (mid + 1, hi)
+            else:  # Query lies on the high side
+                near, far = (mid + 1, hi), (lo, mid)
+            if diff * diff < best_sq:  # The far side may still hold a closer point
+                stack.append((far[0], far[1], 1 - axis))
+            stack.append((near[0], near[1], 1 - axis))  # Visit the near side first
+        return best  # Original index of the nearest point, or -1
+
+class UniformGrid:
+    """Uniform grid spatial hash over normalized map coordinates, updated point by point."""
+
+    __slots__ = ('cell_size', '_cells', '_count')
+
+    def __init__(self, cell_size: float):
+        """Create an empty grid.
+
+        Args:
+            cell_size: Side length of a cell; queries are exact for radii up to this size
+        """
+        self.cell_size = cell_size  # Side length of a cell
+        self._cells: Dict[Tuple[int, int], List[Tuple[str, float, float]]] = {}  # Cell -> (key, x, y) entries
+        self._count = 0  # Number of stored points
+
+    def __len__(self) -> int:
+        return self._count  # Number of stored points
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))  # Cell holding the point
+
+    def insert(self, key: str, x: float, y: float) -> None:
+        """Add a point under the given key."""
+        self._cells.setdefault(self._cell(x, y), []).append((key, x, y))  # Append to its cell
+        self._count += 1
+
+    def bulk_insert(self, keys: List[str], points: np.ndarray) -> None:
+        """Add many points at once; same result as calling insert for each in order.
+
+        Args:
+            keys: Key of each point
+            points: (N, 2) array of the points' x/y coordinates
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)  # Normalize the input shape
+        cells = np.floor(points / self.cell_size).astype(np.int64).tolist()  # Every point's cell in one pass
+        setdefault = self._cells.setdefault  # Bind once for the loop
+        for key, (x, y), (gx, gy) in zip(keys, points.tolist(), cells):
+            setdefault((gx, gy), []).append((key, x, y))
+        self._count += len(cells)
+
+    def remove(self, key: str, x: float, y: float) -> None:
+        """Remove a point previously inserted at (x, y)."""
+        cell = self._cell(x, y)  # Cell the point was filed under
+        entries = self._cells.get(cell, [])
+        for i, entry in enumerate(entries):
+            if entry[0] == key:  # Found the point
+                entries[i] = entries[-1]  # Swap-remove within the cell
+                entries.pop()
+                self._count -= 1
+                break
+        if not entries:  # Drop empty cells
+            self._cells.pop(cell, None)
+
+    def query(self, point: Tuple[float, float], max_distance_sq: float) -> Optional[str]:
+        """Find the key of the point nearest to `point`.
+
+        Args:
+            point: The x/y coordinates to search around
+            max_distance_sq: Only points whose squared distance is strictly below this are considered;
+                must not exceed cell_size ** 2
+
+        Returns:
+            The key of the nearest point, or None if none is in range
+        """
+        px, py = point  # Unpack the query point
+        cx, cy = self._cell(px, py)  # Cell holding the query point
+        best = None  # Nearest key found so far
+        best_sq = max_distance_sq  # Squared search radius, shrinks as points are found
+        for gx in (cx - 1, cx, cx + 1):  # 3x3 block around the query cell
+            for gy in (cy - 1, cy, cy + 1):
+                for key, x, y in self._cells.get((gx, gy), ()):
+                    dx = px - x
+                    dy = py - y
+                    dist_sq = dx * dx + dy * dy  # Squared distance to the candidate
+                    if dist_sq < best_sq:  # Closer than anything seen so far
+                        best_sq = dist_sq
+                        best = key
+        return best  # Nearest key, or None
+
+class SegmentGrid:
+    """Uniform grid that files each line segment under every cell it passes through."""
+
+    __slots__ = ('cell_size', '_cells', '_key_cells')
+
+    def __init__(self, cell_size: float):
+        """Create an empty grid.
+
+        Args:
+            cell_size: Side length of a cell; candidate queries cover radii up to this size
+        """
+        self.cell_size = cell_size  # Side length of a cell
+        self._cells: Dict[Tuple[int, int], Set[Hashable]] = {}  # Cell -> keys of segments crossing it
+        self._key_cells: Dict[Hashable, List[Tuple[int, int]]] = {}  # Key -> cells it was filed under
+
+    def __len__(self) -> int:
+        return len(self._key_cells)  # Number of stored segments
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))  # Cell holding the point
+
+    def _cells_on_segment(self, x1: float, y1: float, x2: float, y2: float) -> List[Tuple[int, int]]:
+        """Cells crossed by a segment, walked cell by cell (Amanatides-Woo traversal)."""
+        cs = self.cell_size
+        cx, cy = self._cell(x1, y1)  # Starting cell
+        ex, ey = self._cell(x2, y2)  # Final cell
+        dx = x2 - x1
+        dy = y2 - y1
+        step_x = 1 if dx > 0 else -1  # Direction of travel between columns
+        step_y = 1 if dy > 0 else -1  # Direction of travel between rows
+        # Parametric distance to the next column/row boundary, and between boundaries
+        t_max_x = ((cx + (step_x > 0)) * cs - x1) / dx if dx else math.inf
+        t_max_y = ((cy + (step_y > 0)) * cs - y1) / dy if dy else math.inf
+        t_delta_x = cs / abs(dx) if dx else math.inf
+        t_delta_y = cs / abs(dy) if dy else math.inf
+        cells = [(cx, cy)]
+        for _ in range(abs(ex - cx) + abs(ey - cy)):  # One boundary crossing per step
+            if t_max_x < t_max_y:
+                cx += step_x
+                t_max_x += t_delta_x
+            else:
+                cy += step_y
+                t_max_y += t_delta_y
+            cells.append((cx, cy))
+        return cells
+
+    def insert(self, key: Hashable, x1: float, y1: float, x2: float, y2: float) -> None:
+        """Add the segment (x1, y1)-(x2, y2) under the given key."""
+        cells = self._cells_on_segment(x1, y1, x2, y2)  # Cells the segment crosses
+        for cell in cells:
+            self._cells.setdefault(cell, set()).add(key)
+        self._key_cells[key] = cells  # Remember them for removal
+
+    def remove(self, key: Hashable) -> None:
+        """Remove a segment; unknown keys are ignored."""
+        for cell in self._key_cells.pop(key, ()):
+            keys = self._cells[cell]
+            keys.discard(key)
+            if not keys:  # Drop empty cells
+                del self._cells[cell]
+
+    def candidates(self, point: Tuple[float, float]) -> Set[Hashable]:
+        """Keys of segments that may lie within cell_size of `point`."""
+        cx, cy = self._cell(*point)  # Cell holding the query point
+        found = set()
+        for gx in (cx - 1, cx, cx + 1):  # 3x3 block around the query cell
+            for gy in (cy - 1, cy, cy + 1):
+                found.update(self._cells.get((gx, gy), ()))
+        return found
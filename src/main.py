@@ -1,3 +1,5 @@
+import logging  # Import logging for debug output
+import numpy as np  # Import NumPy for batched coordinate conversion
 import pygame  # Import the pygame library for game development
 from visualization.map_handler import MapHandler  # Import the MapHandler for managing the map display
 from visualization.console_panel import ConsolePanel  # Import the ConsolePanel for UI elements
@@ -6,6 +8,58 @@ from data.map_editor import MapEditor  # Import the MapEditor for editing the ma
 from algorithms.graph import GraphManager  # Import the GraphManager for managing graph algorithms
 from navigation.nav_handler import NavigationHandler  # Import the NavigationHandler for navigation logic
 
+logger = logging.getLogger(__name__)  # Module-level logger
+
+def _chain_segments(segments):
+    """Join segments end-to-start into polylines, so each can be drawn with one pygame.draw.lines call.
+
+    Segments keep their direction: pygame rasterizes a thick line slightly differently when its
+    endpoints are swapped, so only a segment starting where the chain ends (or ending where it
+    starts) is joined on.
+
+    Args:
+        segments: (start, end) pixel pairs
+
+    Returns:
+        Lists of points; together they cover every segment exactly once
+    """
+    segments = [(tuple(a), tuple(b)) for a, b in segments]  # Hashable endpoints
+    starting = {}  # Point -> indices of the segments starting there
+    ending = {}  # Point -> indices of the segments ending there
+    for i, (a, b) in enumerate(segments):
+        starting.setdefault(a, []).append(i)
+        ending.setdefault(b, []).append(i)
+    used = bytearray(len(segments))  # Segments already placed in a chain
+    chains = []
+    for i, (a, b) in enumerate(segments):
+        if used[i]:
+            continue
+        used[i] = 1
+        head, tail = [a], [b]  # Points before and after the seed segment; head is built backwards
+        for points, links, end in ((tail, starting, 1), (head, ending, 0)):
+            tip = points[0]  # Point being extended from
+            while True:
+                for j in links.get(tip, ()):  # First unused segment continuing from the tip
+                    if not used[j]:
+                        break
+                else:  # Dead end
+                    break
+                used[j] = 1
+                tip = segments[j][end]  # Walk to the segment's far end
+                points.append(tip)
+        head.reverse()
+        chains.append(head + tail)
+    return chains
+
+def _marker_sprite(radius, color, inner_radius=0, inner_color=None):
+    """Node marker drawn once on a transparent surface; blitting it at (x - radius, y - radius)
+    gives the same pixels as drawing the circles centered on (x, y)."""
+    sprite = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)  # Transparent outside the circles
+    pygame.draw.circle(sprite, color, (radius, radius), radius)  # Outer circle
+    if inner_radius:  # Optional colored center
+        pygame.draw.circle(sprite, inner_color, (radius, radius), inner_radius)
+    return sprite.convert_alpha()  # Display format with per-pixel alpha
+
 class CSUFNavigator:
     def __init__(self):
         pygame.init()  # Initialize all imported pygame modules
@@ -18,6 +72,23 @@ class CSUFNavigator:
             self.map_editor  # Pass the map editor instance
         )
         self.text_input = TextInput(self.map_handler.screen, pygame.font.Font(None, 32))  # Create a text input field
+        pygame.event.set_blocked([pygame.MOUSEMOTION, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL, pygame.KEYUP, pygame.TEXTEDITING,
+                                  pygame.ACTIVEEVENT, pygame.WINDOWENTER, pygame.WINDOWLEAVE, pygame.WINDOWMOVED,
+                                  pygame.WINDOWFOCUSGAINED, pygame.WINDOWFOCUSLOST])  # Never queue types _handle_events ignores; TEXTINPUT stays on for typing
+        self.clock = pygame.time.Clock()  # Paces the main loop
+        self.fps = 60  # Frames per second; events are drained and hit-tested at most this often
+        self._pixel_coords = {}  # Location ID -> screen pixel position
+        self._waypoint_sprite = _marker_sprite(4, (255, 255, 0))  # Yellow waypoint dot
+        self._node_sprites = {}  # Center color -> building marker with a white outline
+        self._pixel_xy = np.empty((0, 2), dtype=np.intp)  # Same positions as an array, in location order
+        self._pixel_version = -1  # Map version the pixel cache was built for
+        self._scene = self.map_handler.screen.copy()  # Snapshot of the last drawn map, edges and nodes; reused for every redraw
+        self._scene_cache_key = None  # _scene_key() the snapshot was drawn for
+        self._scene_version = 0  # Bumped when path attributes that affect drawing change outside the editor
+        self._frame_had_events = True  # Whether this frame drained any input; the first frame always draws
+        self._full_update_due = True  # Next frame must push the whole window, not just the console
+        self._console_rect = None  # Screen area the console covered on the previous frame
+        self._selection_rect = None  # Screen area of the route and selected nodes in the last drawn scene
         
         # Don't initialize navigation yet
         self.graph_manager = None  # Placeholder for the graph manager
@@ -26,7 +97,6 @@ class CSUFNavigator:
         # Load map and initialize navigation
         if self.map_editor.load_map():  # Load map immediately
             self.initialize_navigation()  # Initialize only after loading
-            self.console_panel.nav_handler = self.nav_handler  # Link the navigation handler to the console panel
         
         self.edit_mode = True  # Set the initial mode to edit mode
         self.running = True  # Set the running state to true
@@ -36,6 +106,7 @@ class CSUFNavigator:
         print("\nInitializing navigation system...")  # Log initialization
         self.graph_manager = GraphManager(self.map_editor.campus_data)  # Create a graph manager with campus data
         self.nav_handler = NavigationHandler(self.graph_manager, self.console_panel)  # Create a navigation handler
+        self.console_panel.nav_handler = self.nav_handler  # Link the navigation handler to the console panel
         print(f"Graph initialized with {self.graph_manager.G.number_of_nodes()} nodes and {self.graph_manager.G.number_of_edges()} edges")  # Log graph details
 
     def handle_map_load(self):
@@ -52,12 +123,22 @@ class CSUFNavigator:
         while self.running:  # Continue running while the navigator is active
             self._handle_events()  # Handle user input events
             self._update_display()  # Update the display
+            self.clock.tick(self.fps)  # Sleep off the rest of the frame
 
     def _handle_events(self):
         """Handle all events from the pygame event queue."""
-        for event in pygame.event.get():  # Loop through all events
+        if self.nav_handler:  # Pick up a route finished on the worker thread; the scene key sees the change
+            self.nav_handler.poll_route()
+        events = pygame.event.get()  # Pump and drain the queue once per frame
+        self._frame_had_events = bool(events)  # Idle frames skip redrawing entirely
+        if not events:  # Nothing happened this frame
+            return
+        mods = None  # Modifier state for clicks, read at most once per batch
+        for event in events:  # Loop through all events
             if event.type == pygame.QUIT:  # Check if the quit event is triggered
                 self.running = False  # Stop the main loop
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):  # Window contents were lost
+                self._full_update_due = True  # Repaint the whole window next frame
             elif event.type == pygame.KEYDOWN:  # Check for key presses
                 # Handle text input first
                 if self.text_input.active:  # If text input is active
@@ -66,7 +147,7 @@ class CSUFNavigator:
                         if result:  # If text wasn't empty
                             self.map_editor.complete_node_creation(result)  # Complete node creation with the input
                 else:
-                    self._handle_keypress(event.key)  # Handle key presses
+                    self._handle_keypress(event.key, event.mod)  # Key events carry the modifiers held when they were pressed
             elif event.type == pygame.MOUSEBUTTONDOWN:  # Check for mouse button presses
                 if not self.text_input.active:  # If text input is not active
                     # Add this before other click handling
@@ -76,25 +157,22 @@ class CSUFNavigator:
                         if console_click:  # If dropdown was clicked
                             continue  # Skip other click handling
                     
-                    self._handle_mouse_click(event)  # Handle mouse click events
-            elif event.type == pygame.MOUSEMOTION:  # Check for mouse motion events
-                self.mouse_pos = event.pos  # Update mouse position
-            elif event.type == pygame.KEYDOWN:  # Check for key presses again
-                # Handle Ctrl+L for loading
-                if event.key == pygame.K_l and pygame.key.get_mods() & pygame.KMOD_CTRL:  # If Ctrl + L is pressed
-                    self.handle_map_load()  # Load the map
-
-    def _handle_keypress(self, key):
+                    if mods is None:  # Click events carry no modifier state; ask SDL once
+                        mods = pygame.key.get_mods()
+                    self._handle_mouse_click(event, mods)  # Handle mouse click events
+
+    def _handle_keypress(self, key, mods):
         """Handle key presses for various commands."""
+        if key == pygame.K_l and mods & pygame.KMOD_CTRL:  # Ctrl + L loads the map in either mode
+            if self.handle_map_load():  # Reload and rebuild navigation on the new data
+                print("Map loaded!")  # Print confirmation
+            return
         if self.edit_mode:  # If in edit mode
             if key == pygame.K_ESCAPE:  # If the Escape key is pressed
                 self.running = False  # Stop the main loop
-            elif key == pygame.K_s and pygame.key.get_mods() & pygame.KMOD_CTRL:  # If Ctrl + S is pressed
+            elif key == pygame.K_s and mods & pygame.KMOD_CTRL:  # If Ctrl + S is pressed
                 self.map_editor.save_map()  # Save the current map
                 print("Map saved!")  # Print confirmation
-            elif key == pygame.K_l and pygame.key.get_mods() & pygame.KMOD_CTRL:  # If Ctrl + L is pressed
-                self.map_editor.load_map()  # Load a saved map
-                print("Map loaded!")  # Print confirmation
             elif key == pygame.K_e:  # If the E key is pressed
                 self.edit_mode = not self.edit_mode  # Toggle edit mode
                 self.map_editor.edit_mode = self.edit_mode  # Update the map editor's edit mode
@@ -115,7 +193,7 @@ class CSUFNavigator:
                 self.nav_handler.accessibility = not self.nav_handler.accessibility  # Toggle accessibility mode
                 print(f"Accessibility mode: {'ON' if self.nav_handler.accessibility else 'OFF'}")  # Print current accessibility status
 
-    def _handle_mouse_click(self, event):
+    def _handle_mouse_click(self, event, mods):
         """Handle mouse click events for node and edge creation."""
         map_pos = self.map_handler.screen_to_map_coords(event.pos)  # Convert screen position to map coordinates
         
@@ -126,21 +204,21 @@ class CSUFNavigator:
                 # Existing edit mode code
                 if self.map_editor.is_accessible:  # Using map_editor's flag
                     # Handle path accessibility toggling
-                    clicked_path = self.map_handler.get_clicked_path(event.pos, self.graph_manager)  # Get the clicked path
+                    clicked_path = self.map_handler.get_clicked_path(event.pos, self.graph_manager, self.map_editor.map_version)  # Get the clicked path
                     if clicked_path:  # If a path was clicked
                         self._toggle_path_accessibility(clicked_path)  # Toggle accessibility for the path
                 else:  # If not in accessibility editing mode
-                    shift_held = pygame.key.get_mods() & pygame.KMOD_SHIFT  # Check if Shift is held
-                    alt_held = pygame.key.get_mods() & pygame.KMOD_ALT  # Check if Alt is held
+                    shift_held = mods & pygame.KMOD_SHIFT  # Check if Shift is held
+                    alt_held = mods & pygame.KMOD_ALT  # Check if Alt is held
                     
-                    if pygame.mouse.get_pressed()[0] and not alt_held:  # Left click for building
+                    if event.button == 1 and not alt_held:  # Left click for building
                         self.map_editor._handle_node_creation(normalized_pos, event.pos)  # Handle node creation
                         if self.map_editor.pending_node:  # If there is a pending node
                             self.text_input.activate(event.pos)  # Activate text input for naming
                     else:
-                        self.map_editor.handle_click(map_pos, normalized_pos, shift_held, alt_held)  # Handle other clicks
+                        self.map_editor.handle_click(map_pos, normalized_pos, event.button, shift_held, alt_held)  # Handle other clicks
             else:  # If in navigation mode
-                if pygame.mouse.get_pressed()[0]:  # Left click
+                if event.button == 1:  # Left click
                     clicked_node = self.map_editor._find_node_at_position(normalized_pos)  # Find the clicked node
                     if clicked_node and not self.map_editor.campus_data.locations[clicked_node].is_waypoint:  # If a valid node is clicked
                         # Check if we already have both nodes selected
@@ -148,75 +226,176 @@ class CSUFNavigator:
                             print("2 nodes already selected. Press 'R' to reset selection.")  # Inform user about selection
                         else:
                             self.nav_handler.handle_node_click(clicked_node)  # Handle node click for navigation
-                            print(f"Selected node: {clicked_node}")  # Print the selected node
+                            logger.debug("Selected node: %s", clicked_node)  # Log the selected node
 
     def _update_display(self):
         """Update the display with current state."""
-        self.map_handler.screen.fill((0, 0, 0))  # Fill with black background
+        key = self._scene_key()  # Everything the map, edge and node layers depend on
+        redraw = key != self._scene_cache_key  # Something on the map changed
+        if not (redraw or self._frame_had_events or self._full_update_due or self.text_input.active):
+            return  # Idle frame: the window already shows the right picture
+        scene_rects = None  # Map areas to push when only they changed; None pushes the whole window
+        if redraw:  # Redraw and keep a copy
+            selection_only = (self._scene_cache_key is not None
+                              and key[:-1] == self._scene_cache_key[:-1])  # Same map; only route or selection moved
+            self._draw_scene()
+            self._scene.blit(self.map_handler.screen, (0, 0))  # Snapshot before the UI is drawn on top
+            self._scene_cache_key = key
+            selection_rect = self._selection_bounds()  # Where the new route and selection were drawn
+            if selection_only:  # Old and new selection areas cover every changed pixel
+                scene_rects = [r for r in (self._selection_rect, selection_rect) if r]
+            self._selection_rect = selection_rect
+        else:  # Unchanged scene: one blit instead of every line and circle
+            self.map_handler.screen.blit(self._scene, (0, 0))
+
+        # Draw UI elements
+        console_rect = self.console_panel.draw()  # Draw the console panel
+        if self.text_input.active:  # If text input is active
+            self.text_input.draw()  # Draw the text input field
+
+        if self._full_update_due or self.text_input.active or (redraw and scene_rects is None):  # Whole map may differ
+            pygame.display.flip()  # Update the display
+        elif redraw:  # Only the route, the selection and the console can differ
+            scene_rects.append(console_rect.union(self._console_rect or console_rect))
+            pygame.display.update(scene_rects)
+        else:  # Only the console can differ from what is on screen
+            pygame.display.update(console_rect.union(self._console_rect or console_rect))  # Also clear last frame's console area
+        self._console_rect = console_rect
+        self._full_update_due = self.text_input.active  # Closing the overlay must repaint the map it dimmed
+
+    def _draw_scene(self):
+        """Draw the map, edges and nodes onto the screen."""
+        screen = self.map_handler.screen  # Target surface, bound once for the loops below
+        draw_lines = pygame.draw.lines  # Local bindings skip attribute lookups per polyline
+        screen.fill((0, 0, 0))  # Fill with black background
         self.map_handler.draw_map()  # Draw the map
         
-        # Draw edges
-        for path in self.map_editor.campus_data.paths:  # Iterate through all paths
-            start_loc = self.map_editor.campus_data.locations[path.start_id]  # Get start location
-            end_loc = self.map_editor.campus_data.locations[path.end_id]  # Get end location
-            start_pos = (
-                int(start_loc.x * self.map_handler.map_width) + self.map_handler.console_width,  # Calculate start position
-                int(start_loc.y * self.map_handler.window_height)  # Calculate start position
-            )
-            end_pos = (
-                int(end_loc.x * self.map_handler.map_width) + self.map_handler.console_width,  # Calculate end position
-                int(end_loc.y * self.map_handler.window_height)  # Calculate end position
-            )
-            
-            # Draw path with different color based on mode and accessibility
-            if self.edit_mode and self.map_editor.is_accessible:  # In accessibility editing mode
-                # Show green for accessible paths
-                color = (0, 255, 0) if path.is_accessible else (255, 255, 0)  # Green if accessible, yellow otherwise
-                pygame.draw.line(self.map_handler.screen, color, start_pos, end_pos, 2)  # Draw the path
-            elif not self.edit_mode and self.nav_handler.nav_state.current_path:  # In navigation mode with a current path
-                path_nodes = self.nav_handler.nav_state.current_path['nodes']  # Get current path nodes
-                if (path.start_id in path_nodes and path.end_id in path_nodes and 
-                    abs(path_nodes.index(path.start_id) - path_nodes.index(path.end_id)) == 1):  # Check if path is part of the route
-                    # Path is part of the route - draw in red
-                    pygame.draw.line(self.map_handler.screen, (255, 0, 0), start_pos, end_pos, 4)  # Draw the path in red
-                else:
-                    # Regular path - draw in yellow
-                    pygame.draw.line(self.map_handler.screen, (255, 255, 0), start_pos, end_pos, 2)  # Draw the path in yellow
-            else:
-                # Regular path - draw in yellow
-                pygame.draw.line(self.map_handler.screen, (255, 255, 0), start_pos, end_pos, 2)  # Draw the path in yellow
+        # Draw edges one color class at a time, route highlights last so they sit on top
+        screen.lock()  # Hold one lock across the whole batch instead of one per line
+        try:
+            for color, width, segments in self._edge_batches():
+                for points in _chain_segments(segments):  # Connected runs of same-style edges
+                    draw_lines(screen, color, False, points, width)  # One call per run
+            for points in self._route_polylines():  # Route on top, one call per unbroken run of legs
+                draw_lines(screen, (255, 0, 0), False, points, 4)  # Draw the route in red
+        finally:
+            screen.unlock()
 
         # Draw nodes
+        pixels = self._location_pixels()  # Cached screen positions
+        default_color = (50, 100, 150)  # Default color for unselected nodes and edit mode
+        selected = ()  # Nodes drawn in the selection color
+        if not self.edit_mode:  # Different colors for selected nodes in navigation mode
+            nav_state = self.nav_handler.nav_state  # Current selection
+            selected = (nav_state.start_node, nav_state.end_node)  # Start and end nodes
+            selected_color = nav_state.path_colors['selected']  # Get selected color
+            selected_sprite = self._node_sprite(selected_color)  # Marker for the start and end nodes
+        waypoint_sprite = self._waypoint_sprite  # Yellow dot
+        default_sprite = self._node_sprite(default_color)  # Marker for every other building
+        stamps = []  # (sprite, top-left) pairs, in drawing order
         for loc_id, location in self.map_editor.campus_data.locations.items():  # Iterate through all locations
-            pos = (
-                int(location.x * self.map_handler.map_width) + self.map_handler.console_width,  # Calculate position
-                int(location.y * self.map_handler.window_height)  # Calculate position
-            )
+            x, y = pixels[loc_id]  # Screen position of the location
             
             if location.is_waypoint:  # If the location is a waypoint
-                # Draw waypoints in yellow
-                pygame.draw.circle(self.map_handler.screen, (255, 255, 0), pos, 4)  # Draw waypoint
+                stamps.append((waypoint_sprite, (x - 4, y - 4)))  # Draw waypoint in yellow
             else:  # If not a waypoint
-                # Different colors for selected nodes in navigation mode
-                if not self.edit_mode:  # If not in edit mode
-                    if loc_id == self.nav_handler.nav_state.start_node:  # If this is the start node
-                        color = self.nav_handler.nav_state.path_colors['selected']  # Get selected color
-                    elif loc_id == self.nav_handler.nav_state.end_node:  # If this is the end node
-                        color = self.nav_handler.nav_state.path_colors['selected']  # Get selected color
-                    else:
-                        color = (50, 100, 150)  # Default color for other nodes
-                else:
-                    color = (50, 100, 150)  # Default color for edit mode
-                    
-                pygame.draw.circle(self.map_handler.screen, (255, 255, 255), pos, 8)  # Draw white outline
-                pygame.draw.circle(self.map_handler.screen, color, pos, 6)  # Draw colored center
+                sprite = selected_sprite if loc_id in selected else default_sprite  # Selected or default color
+                stamps.append((sprite, (x - 8, y - 8)))  # White outline with a colored center
+        screen.blits(stamps, doreturn=0)  # Every node in one call
 
-        # Draw UI elements
-        self.console_panel.draw()  # Draw the console panel
-        if self.text_input.active:  # If text input is active
-            self.text_input.draw()  # Draw the text input field
+    def _node_sprite(self, color):
+        """Building marker with the given center color, drawn on first use."""
+        sprite = self._node_sprites.get(color)
+        if sprite is None:
+            sprite = self._node_sprites[color] = _marker_sprite(8, (255, 255, 255), 6, color)
+        return sprite
 
-        pygame.display.flip()  # Update the display
+    def _selection_bounds(self):
+        """Screen area covered by the route and the selected node markers, or None if nothing is selected."""
+        if self.edit_mode:  # Selection only shows in navigation mode
+            return None
+        pixels = self._location_pixels()  # Cached screen positions
+        nav_state = self.nav_handler.nav_state  # Current selection and route
+        rects = [pygame.Rect(x - 8, y - 8, 17, 17)  # Building marker footprint
+                 for x, y in (pixels[n] for n in (nav_state.start_node, nav_state.end_node) if n in pixels)]
+        if nav_state.current_path:  # Route legs, including ones edited away, and the yellow edges they covered
+            points = [pixels[n] for n in nav_state.current_path['nodes'] if n in pixels]
+            if points:
+                xs, ys = zip(*points)
+                rects.append(pygame.Rect(min(xs), min(ys), max(xs) - min(xs) + 1, max(ys) - min(ys) + 1).inflate(10, 10))
+        return rects[0].unionall(rects[1:]) if rects else None
+
+    def _scene_key(self):
+        """State that determines how the map, edges and nodes are drawn."""
+        route = None  # Selection only colors the scene in navigation mode
+        if not self.edit_mode:
+            nav_state = self.nav_handler.nav_state  # Current selection and route
+            route = (nav_state.start_node, nav_state.end_node, nav_state.route_edge_set)
+        return (self.map_editor.map_version, self._scene_version, self.map_handler.current_map,
+                self.edit_mode, self.map_editor.is_accessible, route)
+
+    def _location_pixels(self):
+        """Screen pixel position of every location, recomputed only after the map changes."""
+        if self._pixel_version != self.map_editor.map_version:  # Nodes or edges were edited or reloaded
+            campus_data = self.map_editor.campus_data  # Current map data
+            ids = list(campus_data.locations)  # Location IDs
+            rows = np.fromiter((campus_data.loc_rows[loc_id] for loc_id in ids), np.intp, len(ids))  # Their coordinate rows
+            scale = (self.map_handler.map_width, self.map_handler.window_height)  # Normalized -> map pixels
+            offset = (self.map_handler.console_width, 0)  # Map area starts right of the console
+            pixels = (campus_data.loc_xy[rows] * scale).astype(np.intp) + offset  # Truncate like int() in one pass
+            self._pixel_xy = pixels  # Indexed by the path columns' location indices
+            self._pixel_coords = dict(zip(ids, map(tuple, pixels.tolist())))  # ID -> (x, y)
+            self._pixel_version = self.map_editor.map_version
+        return self._pixel_coords
+
+    def _edge_batches(self):
+        """Group edge segments by drawing style.
+
+        Returns:
+            (color, width, segments) tuples in drawing order, with segments as pixel (start, end) pairs;
+            route legs are left out (see _route_polylines)
+        """
+        campus_data = self.map_editor.campus_data  # Current map data
+        campus_data.refresh_columns()  # Path columns in step with the current locations
+        self._location_pixels()  # Pixel array in the same location order
+        starts = self._pixel_xy[campus_data.path_start]  # Start pixel of every path
+        ends = self._pixel_xy[campus_data.path_end]  # End pixel of every path
+
+        # Split into highlighted and regular segments for the current mode
+        if self.edit_mode and self.map_editor.is_accessible:  # In accessibility editing mode
+            highlight, color, width = campus_data.path_accessible, (0, 255, 0), 2  # Accessible paths in green
+        elif not self.edit_mode and self.nav_handler.nav_state.current_path:  # In navigation mode with a current path
+            route = self.nav_handler.nav_state.route_edge_set  # Route legs in both directions, built with the route
+            on_route = campus_data.path_mask(route)  # Drawn separately as polylines
+            return [((255, 255, 0), 2, list(zip(starts[~on_route].tolist(), ends[~on_route].tolist())))]
+        else:  # Everything is a regular path
+            return [((255, 255, 0), 2, list(zip(starts.tolist(), ends.tolist())))]
+        regular = list(zip(starts[~highlight].tolist(), ends[~highlight].tolist()))  # Drawn in yellow
+        marked = list(zip(starts[highlight].tolist(), ends[highlight].tolist()))  # Drawn on top in the highlight color
+        return [((255, 255, 0), 2, regular), (color, width, marked)]
+
+    def _route_polylines(self):
+        """Pixel polylines along the current route in navigation mode.
+
+        Returns:
+            Lists of pixel points, one per run of consecutive route legs that still have a stored path
+        """
+        if self.edit_mode or not self.nav_handler.nav_state.current_path:  # Routes only show in navigation mode
+            return []
+        campus_data = self.map_editor.campus_data  # Current map data
+        pixels = self._location_pixels()  # Cached screen positions
+        nodes = self.nav_handler.nav_state.current_path['nodes']  # Route in travel order
+        runs = []  # Polylines to draw
+        run = None  # Polyline being extended
+        for a, b in zip(nodes, nodes[1:]):  # Walk the route leg by leg
+            if not campus_data.has_path(a, b):  # Leg was edited away; break the line here
+                run = None
+                continue
+            if run is None:  # Start a new polyline at this leg
+                run = [pixels[a]]
+                runs.append(run)
+            run.append(pixels[b])  # Extend it to the leg's end
+        return runs
 
     def _draw(self):
         """Draw the application window"""
@@ -227,7 +406,7 @@ class CSUFNavigator:
         if self.nav_handler.nav_state.current_path:  # If there is a current path
             current_path = self.nav_handler.nav_state.current_path['nodes']  # Get current path nodes
         
-        self.map_handler.draw_graph(self.graph_manager, current_path)  # Draw the graph with current path
+        self.map_handler.draw_graph(self.graph_manager, current_path, self.map_editor.map_version)  # Draw the graph with current path
         self.console_panel.draw()  # Draw the console panel
         
         pygame.display.flip()  # Update the display
@@ -235,13 +414,19 @@ class CSUFNavigator:
     def _toggle_path_accessibility(self, path_ids: tuple):
         """Toggle accessibility for a path"""
         start_id, end_id = path_ids  # Unpack path IDs
-        for path in self.map_editor.campus_data.paths:  # Iterate through all paths
-            if ((path.start_id == start_id and path.end_id == end_id) or
-                (path.start_id == end_id and path.end_id == start_id)):  # Check if path matches
-                path.is_accessible = not path.is_accessible  # Toggle accessibility
-                print(f"Toggled accessibility for path {start_id} -> {end_id}: {path.is_accessible}")  # Log accessibility change
-                break  # Exit loop after toggling
+        path = self.map_editor.campus_data.neighbors(start_id).get(end_id)  # O(1) lookup in either direction
+        if path is None:  # No path between the two locations
+            return
+        path.is_accessible = not path.is_accessible  # Toggle accessibility
+        self._scene_version += 1  # Edge colors in accessibility mode changed
+        logger.debug("Toggled accessibility for path %s -> %s: %s", start_id, end_id, path.is_accessible)  # Log accessibility change
+        self.map_editor.campus_data.finalize()  # Refresh the columnar accessibility flags
+        if self.graph_manager:  # Cached accessible subgraph is now stale
+            # Build a fresh manager rather than rebuilding in place: a route search may be running on the old one
+            self.graph_manager = GraphManager(self.map_editor.campus_data)
+            self.nav_handler.set_graph(self.graph_manager)  # Swap it in and drop routes from the old graph
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)  # Debug messages stay silent unless the level is lowered
     navigator = CSUFNavigator()  # Create an instance of CSUFNavigator
     navigator.run()  # Run the navigator
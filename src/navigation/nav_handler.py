@@ -1,31 +1,38 @@
+import logging  # Import logging for debug output
+import queue  # Import queue to hand routes from the worker thread to the main loop
+import threading  # Import threading to keep route searches off the UI thread
 from algorithms.graph import GraphManager  # Import the GraphManager for graph-related operations
 from navigation.nav_state import NavigationState  # Import the NavigationState to manage navigation state
-import networkx as nx  # Import NetworkX for graph algorithms
+
+logger = logging.getLogger(__name__)  # Module-level logger
 
 class NavigationHandler:
     def __init__(self, graph_manager: GraphManager, console_panel):
         """Initialize the NavigationHandler with a graph manager and console panel."""
-        print("\nInitializing NavigationHandler")  # Debug message for initialization
+        logger.debug("Initializing NavigationHandler")  # Debug message for initialization
         self.graph = graph_manager  # Store the graph manager instance
         self.nav_state = NavigationState()  # Initialize navigation state
         self.console_panel = console_panel  # Store the console panel reference
         self.accessibility = False  # Flag to indicate if accessibility mode is enabled
-        print(f"Navigation handler initialized with graph containing {self.graph.G.number_of_nodes()} nodes")  # Debug message for node count
+        self._route_request = 0  # Bumped per route request and reset; only the latest result is applied
+        self._route_inbox = queue.Queue()  # Route requests waiting for the worker thread
+        self._route_results = queue.Queue()  # (request, route) pairs finished by the worker thread
+        self._route_thread = None  # Long-lived worker, started on the first request
+        self._route_pending = False  # Whether the current request's result has yet to be applied
+        logger.debug("Navigation handler initialized with graph containing %d nodes", self.graph.G.number_of_nodes())  # Debug message for node count
         
     def handle_node_click(self, node_id: str) -> None:
         """Handle node selection in navigation mode."""
-        print(f"\nHandling node click: {node_id}")  # Debug message for node click
-        print(f"Graph has {self.graph.G.number_of_nodes()} nodes")  # Debug message for graph node count
-        print(f"Node exists in graph: {node_id in self.graph.G}")  # Debug message for node existence
+        logger.debug("Handling node click: %s (in graph: %s)", node_id, node_id in self.graph.G)  # Debug message for node click
         
         # Check if start node is not set
         if not self.nav_state.start_node:
             self.nav_state.start_node = node_id  # Set the start node
-            print(f"Set start node: {node_id}")  # Debug message for setting start node
+            logger.debug("Set start node: %s", node_id)  # Debug message for setting start node
         # Check if end node is not set
         elif not self.nav_state.end_node:
             self.nav_state.end_node = node_id  # Set the end node
-            print(f"Set end node: {node_id}")  # Debug message for setting end node
+            logger.debug("Set end node: %s", node_id)  # Debug message for setting end node
             self._calculate_path()  # Calculate the path after setting end node
     
     def reset_selection(self) -> None:
@@ -33,196 +40,249 @@ class NavigationHandler:
         self.nav_state.start_node = None  # Clear the start node
         self.nav_state.end_node = None  # Clear the end node
         self.nav_state.current_path = None  # Clear the current path
+        self._route_request += 1  # Drop any route still being calculated
+        self._route_pending = False  # Nothing to wait for
+
+    def set_graph(self, graph_manager: GraphManager) -> None:
+        """Switch to a rebuilt graph manager.
+
+        Searches already running keep the manager they started with; their results are
+        dropped, and a pending request is restarted on the new graph.
+        """
+        self.graph = graph_manager  # Swap the reference; the old manager is never mutated
+        if self._route_pending:  # A route for the current selection was still being calculated
+            self._calculate_path()  # Recalculate on the new graph; supersedes the old request
+        else:
+            self._route_request += 1  # Drop any stale result still in flight
     
     def _calculate_path(self) -> None:
-        """Calculate path based on current settings and selected algorithm."""
-        print(f"\nCalculating path from {self.nav_state.start_node} to {self.nav_state.end_node}")  # Debug message for path calculation
-        print(f"Using algorithm: {self.console_panel.selected_algorithm}")  # Debug message for selected algorithm
-        print(f"Accessibility mode: {'ON' if self.accessibility else 'OFF'}")  # Debug message for accessibility mode
-        
+        """Queue the route for the current selection on the background worker.
+
+        The result is applied by poll_route(), which the main loop calls every frame.
+        """
+        start_node, end_node = self.nav_state.start_node, self.nav_state.end_node  # Selection being routed
         algorithm = self.console_panel.selected_algorithm  # Get the selected algorithm
-        result = None  # Initialize result variable
+        accessibility = self.accessibility  # Mode at the time of the request
+        logger.debug("Calculating path from %s to %s using %s, accessibility mode %s",
+                     start_node, end_node, algorithm, 'ON' if accessibility else 'OFF')  # Debug message for path calculation
+        self._route_request += 1  # Supersedes any request still running
+        self._route_pending = True  # Until its result is applied
+        self._route_inbox.put((self._route_request, self.graph, start_node, end_node, algorithm, accessibility))
+        if self._route_thread is None:  # One worker serves every request, so searches never pile up
+            self._route_thread = threading.Thread(
+                target=self._route_worker,
+                daemon=True  # A long all-paths search must not keep the app from exiting
+            )
+            self._route_thread.start()
+
+    def _route_worker(self) -> None:
+        """Thread body: compute the newest queued route and hand it to the main thread, forever.
+
+        Requests queued while a search ran are drained down to the newest one, and requests
+        superseded by a reset or graph swap are skipped, so at most one search runs at a time.
+        """
+        inbox = self._route_inbox  # Local binding for the loop
+        while True:
+            job = inbox.get()  # Sleep until a request arrives
+            while True:  # Keep only the newest of any requests that queued up
+                try:
+                    job = inbox.get_nowait()
+                except queue.Empty:
+                    break
+            request, graph, start_node, end_node, algorithm, accessibility = job  # Unpack the request
+            if request != self._route_request:  # Reset or replaced before it started
+                continue
+            try:
+                route = self._find_route(graph, start_node, end_node, algorithm, accessibility)  # Search on the worker thread
+            except Exception:  # Never lose a request; report it as no route
+                logger.exception("Route calculation failed")  # Log with traceback
+                route = None
+            self._route_results.put((request, route))  # Hand over to poll_route
+
+    def poll_route(self) -> bool:
+        """Apply the newest finished route calculation, if any, without waiting.
+
+        Returns:
+            True if a result for the current selection was applied
+        """
+        applied = False  # Whether the selection's route was set
+        while True:
+            try:
+                request, route = self._route_results.get_nowait()  # Next finished calculation
+            except queue.Empty:  # Nothing (more) has finished
+                return applied
+            if request == self._route_request:  # Ignore results for selections since reset or replaced
+                self._route_pending = False
+                self._apply_route(route)
+                applied = True
+
+    def _apply_route(self, route) -> None:
+        """Store a finished route in the navigation state and report it."""
+        self.nav_state.current_path = route  # Route dict, or None if nothing was found
         
+        # Report results
+        if self.nav_state.current_path:  # If a path is found
+            if logger.isEnabledFor(logging.DEBUG):  # Skip building the route string when debug output is off
+                logger.debug("Path found: %s (total distance %.2f meters)", ' -> '.join(route['nodes']), route['distance'])
+        else:  # If no path is found
+            logger.debug("No path found between selected nodes; clearing the selection")  # Debug message
+            # Reset node selection when no path is found
+            self.reset_selection()  # Clear selections
+
+    def _find_route(self, graph: GraphManager, start_node: str, end_node: str, algorithm: str, accessibility: bool):
+        """Run the selected algorithm between two nodes on the graph captured for the request.
+
+        Returns:
+            Dict with the route's 'nodes' and 'distance', or None if there is no route
+        """
         # Check if accessibility mode is not enabled
-        if not self.accessibility:
+        if not accessibility:
             # Check for Dijkstra's Algorithm
             if algorithm == "Dijkstra's Algorithm":
-                result = self.graph.dijkstra(  # Call Dijkstra's algorithm
-                    self.nav_state.start_node,
-                    self.nav_state.end_node
+                result = graph.dijkstra(  # Call Dijkstra's algorithm
+                    start_node,
+                    end_node
                 )
                 if result:  # If a result is returned
                     path, distance = result  # Unpack the path and distance
-                    self.nav_state.current_path = {  # Store the current path
+                    return {  # Route found
+                        'nodes': path,
+                        'distance': distance
+                    }
+            
+            # Check for A* Search
+            elif algorithm == "A* Search":
+                result = graph.astar(  # Call A* search
+                    start_node,
+                    end_node
+                )
+                if result:  # If a result is returned
+                    path, distance = result  # Unpack the path and distance
+                    return {  # Route found
                         'nodes': path,
                         'distance': distance
                     }
             
             # Check for Breadth-First Search
             elif algorithm == "Breadth-First Search":
-                path = self.graph.bfs(  # Call BFS algorithm
-                    self.nav_state.start_node,
-                    self.nav_state.end_node
+                path = graph.bfs(  # Call BFS algorithm
+                    start_node,
+                    end_node
                 )
                 if path:  # If a path is found
-                    # Calculate distance for BFS path
-                    distance = sum(self.graph.G[path[i]][path[i+1]]['weight'] 
-                                for i in range(len(path)-1))  # Sum weights of edges in the path
-                    self.nav_state.current_path = {  # Store the current path
+                    distance = graph.path_distance(path)  # Sum cached edge weights along the BFS path
+                    return {  # Route found
                         'nodes': path,
                         'distance': distance
                     }
             
             # Check for Depth-First Search
             elif algorithm == "Depth-First Search":
-                # Get all possible paths
-                all_paths = self.graph.dfs_all_paths(  # Call DFS to get all paths
-                    self.nav_state.start_node,
-                    self.nav_state.end_node
+                # Path with the most landmarks, memoized by the graph manager
+                result = graph.landmark_path(  # Enumerates all paths on the first request only
+                    start_node,
+                    end_node
                 )
                 
-                if all_paths:  # If any paths are found
-                    # For now, choose the path with most landmarks
-                    paths_with_metrics = []  # List to store paths with metrics
-                    for path in all_paths:  # Iterate through all paths
-                        distance = sum(self.graph.G[path[i]][path[i+1]]['weight'] 
-                                    for i in range(len(path)-1))  # Calculate distance
-                        landmarks = sum(1 for node in path 
-                                    if not node.startswith('waypoint_'))  # Count landmarks
-                        paths_with_metrics.append((path, distance, landmarks))  # Append metrics to list
-                    
-                    # Sort by number of landmarks (could be changed to other criteria)
-                    paths_with_metrics.sort(key=lambda x: x[2], reverse=True)  # Sort paths by landmarks
-                    best_path = paths_with_metrics[0]  # Select the best path
-                    
-                    self.nav_state.current_path = {  # Store the current path
-                        'nodes': best_path[0],
-                        'distance': best_path[1]
+                if result:  # If any paths are found
+                    path, distance = result  # Unpack the path and distance
+                    if logger.isEnabledFor(logging.DEBUG):  # Skip the join and landmark count when debug output is off
+                        logger.debug("Chose path with most landmarks: %s (%.2f meters, %d landmarks)",
+                                     ' -> '.join(path), distance, graph.count_landmarks(path))  # Debug message for chosen path
+                    return {  # Route found
+                        'nodes': path,
+                        'distance': distance
                     }
-                    print(f"\nChose path with most landmarks:")  # Debug message for chosen path
-                    print(f"Path: {' -> '.join(best_path[0])}")  # Print the path
-                    print(f"Distance: {best_path[1]:.2f} meters")  # Print the distance
-                    print(f"Landmarks: {best_path[2]}")  # Print the number of landmarks
         else:  # If accessibility mode is enabled
             try:
-                # Create a subgraph with only accessible paths
-                accessible_edges = []  # List to store accessible edges
-                for path in self.graph.campus_data.paths:  # Iterate through all paths
-                    if path.is_accessible:  # Check if the path is accessible
-                        accessible_edges.append((path.start_id, path.end_id))  # Append accessible edges
-                
-                if not accessible_edges:  # If no accessible edges are found
-                    print("No accessible paths found in the graph!")  # Debug message
-                    self.nav_state.current_path = None  # Clear current path
-                    return  # Exit the function
+                # Use the accessible subgraph cached by the graph manager
+                G_accessible = graph.G_accessible  # Subgraph of accessible edges
                 
-                # Create accessible subgraph
-                G_accessible = self.graph.G.edge_subgraph(accessible_edges)  # Create subgraph of accessible edges
+                if G_accessible.number_of_edges() == 0:  # If no accessible edges are found
+                    logger.debug("No accessible paths found in the graph")  # Debug message
+                    return None  # No route
                 
                 # Check if both nodes are in the accessible subgraph
-                if (self.nav_state.start_node not in G_accessible or 
-                    self.nav_state.end_node not in G_accessible):
-                    print("Start or end node not connected to any accessible paths!")  # Debug message
-                    self.nav_state.current_path = None  # Clear current path
-                    return  # Exit the function
+                if (start_node not in G_accessible or 
+                    end_node not in G_accessible):
+                    logger.debug("Start or end node not connected to any accessible paths")  # Debug message
+                    return None  # No route
                 
                 # Check for Dijkstra's Algorithm in accessibility mode
                 if algorithm == "Dijkstra's Algorithm":
-                    try:
-                        path = nx.shortest_path(G_accessible,  # Find shortest path in accessible graph
-                            self.nav_state.start_node,
-                            self.nav_state.end_node,
-                            weight='weight')
-                        distance = nx.shortest_path_length(G_accessible,  # Calculate path length
-                            self.nav_state.start_node,
-                            self.nav_state.end_node,
-                            weight='weight')
-                        self.nav_state.current_path = {  # Store the current path
+                    result = graph.dijkstra(  # Path and length from one traversal of accessible edges
+                        start_node,
+                        end_node,
+                        accessible_only=True
+                    )
+                    if result:  # If a result is returned
+                        path, distance = result  # Unpack the path and distance
+                        return {  # Route found
                             'nodes': path,
                             'distance': distance
                         }
-                    except (nx.NetworkXNoPath, nx.NodeNotFound):  # Handle exceptions
-                        print("No accessible path found between selected nodes!")  # Debug message
-                        self.nav_state.current_path = None  # Clear current path
+                    else:
+                        logger.debug("No accessible path found between selected nodes")  # Debug message
+                        return None  # No route
+                        
+                # Check for A* Search in accessibility mode
+                elif algorithm == "A* Search":
+                    result = graph.astar(  # Call A* search restricted to accessible edges
+                        start_node,
+                        end_node,
+                        accessible_only=True
+                    )
+                    if result:  # If a result is returned
+                        path, distance = result  # Unpack the path and distance
+                        return {  # Route found
+                            'nodes': path,
+                            'distance': distance
+                        }
+                    else:
+                        logger.debug("No accessible path found between selected nodes")  # Debug message
+                        return None  # No route
                         
                 # Check for Breadth-First Search in accessibility mode
                 elif algorithm == "Breadth-First Search":
-                    try:
-                        path = nx.single_source_shortest_path(G_accessible,  # Find path using BFS
-                            self.nav_state.start_node)[self.nav_state.end_node]
-                        # Calculate distance for BFS path
-                        distance = sum(self.graph.G[path[i]][path[i+1]]['weight'] 
-                                     for i in range(len(path)-1))  # Sum weights of edges in the path
-                        self.nav_state.current_path = {  # Store the current path
+                    path = graph.bfs(  # Early-exit BFS restricted to accessible edges
+                        start_node,
+                        end_node,
+                        accessible_only=True
+                    )
+                    if path:  # If a path is found
+                        distance = graph.path_distance(path)  # Sum cached edge weights along the BFS path
+                        return {  # Route found
                             'nodes': path,
                             'distance': distance
                         }
-                    except (nx.NetworkXNoPath, nx.NodeNotFound, KeyError):  # Handle exceptions
-                        print("No accessible path found between selected nodes!")  # Debug message
-                        self.nav_state.current_path = None  # Clear current path
+                    else:
+                        logger.debug("No accessible path found between selected nodes")  # Debug message
+                        return None  # No route
                         
                 # Check for Depth-First Search in accessibility mode
                 elif algorithm == "Depth-First Search":
-                    # Get all possible accessible paths
-                    all_paths = []  # List to store all accessible paths
-                    def dfs_accessible_paths(current, target, path, visited):
-                        """Recursive function to find all accessible paths using DFS."""
-                        path.append(current)  # Add current node to path
-                        if current == target:  # If target is reached
-                            all_paths.append(path.copy())  # Append the found path
-                        else:
-                            for neighbor in G_accessible.neighbors(current):  # Iterate through neighbors
-                                if neighbor not in visited:  # Check if neighbor is not visited
-                                    visited.add(neighbor)  # Mark neighbor as visited
-                                    dfs_accessible_paths(neighbor, target, path, visited)  # Recur for neighbor
-                                    visited.remove(neighbor)  # Unmark neighbor after recursion
-                        path.pop()  # Remove current node from path
-
-                    try:
-                        dfs_accessible_paths(self.nav_state.start_node,  # Start DFS from start node
-                                           self.nav_state.end_node, 
-                                           [],  # Initialize empty path
-                                           {self.nav_state.start_node})  # Initialize visited set
-                        
-                        if all_paths:  # If any accessible paths are found
-                            # Calculate metrics for each path
-                            paths_with_metrics = []  # List to store paths with metrics
-                            for path in all_paths:  # Iterate through all paths
-                                distance = sum(self.graph.G[path[i]][path[i+1]]['weight'] 
-                                             for i in range(len(path)-1))  # Calculate distance
-                                landmarks = sum(1 for node in path 
-                                              if not node.startswith('waypoint_'))  # Count landmarks
-                                paths_with_metrics.append((path, distance, landmarks))  # Append metrics to list
-                            
-                            # Sort by number of landmarks
-                            paths_with_metrics.sort(key=lambda x: x[2], reverse=True)  # Sort paths by landmarks
-                            best_path = paths_with_metrics[0]  # Select the best path
-                            
-                            self.nav_state.current_path = {  # Store the current path
-                                'nodes': best_path[0],
-                                'distance': best_path[1]
-                            }
-                            print(f"\nChose accessible path with most landmarks:")  # Debug message for chosen path
-                            print(f"Path: {' -> '.join(best_path[0])}")  # Print the path
-                            print(f"Distance: {best_path[1]:.2f} meters")  # Print the distance
-                            print(f"Landmarks: {best_path[2]}")  # Print the number of landmarks
-                        else:  # If no accessible paths are found
-                            print("No accessible path found between selected nodes!")  # Debug message
-                            self.nav_state.current_path = None  # Clear current path
-                    except (nx.NetworkXNoPath, nx.NodeNotFound) as e:  # Handle exceptions
-                        print(f"Error finding accessible path: {str(e)}")  # Debug message
-                        self.nav_state.current_path = None  # Clear current path
+                    # Accessible path with the most landmarks, memoized by the graph manager
+                    result = graph.landmark_path(  # Enumerates accessible paths on the first request only
+                        start_node,
+                        end_node,
+                        accessible_only=True
+                    )
+                    
+                    if result:  # If any accessible paths are found
+                        path, distance = result  # Unpack the path and distance
+                        if logger.isEnabledFor(logging.DEBUG):  # Skip the join and landmark count when debug output is off
+                            logger.debug("Chose accessible path with most landmarks: %s (%.2f meters, %d landmarks)",
+                                         ' -> '.join(path), distance, graph.count_landmarks(path))  # Debug message for chosen path
+                        return {  # Route found
+                            'nodes': path,
+                            'distance': distance
+                        }
+                    else:  # If no accessible paths are found
+                        logger.debug("No accessible path found between selected nodes")  # Debug message
+                        return None  # No route
                         
-            except Exception as e:  # Handle any other exceptions
-                print(f"Error finding accessible path: {str(e)}")  # Debug message
-                self.nav_state.current_path = None  # Clear current path
+            except Exception:  # Handle any other exceptions
+                logger.exception("Error finding accessible path")  # Log with traceback
+                return None  # No route
         
-        # Print results
-        if self.nav_state.current_path:  # If a path is found
-            print(f"Path found: {' -> '.join(self.nav_state.current_path['nodes'])}")  # Print the path
-            print(f"Total distance: {self.nav_state.current_path['distance']:.2f} meters")  # Print the total distance
-        else:  # If no path is found
-            print("No path found between selected nodes!")  # Debug message
-            print("No path is currently set in navigation state")  # Debug message
-            # Reset node selection when no path is found
-            self.reset_selection()  # Clear selections
\ No newline at end of file
+        return None  # No route
@@ -1,11 +1,31 @@
+_PATH_COLORS = {
+    "fastest": (0, 255, 0),      # Green
+    "accessible": (0, 150, 255),  # Light Blue
+    "selected": (255, 165, 0),    # Orange for selected nodes
+    "highlight": (255, 255, 0)    # Yellow for hovering
+}
+
 class NavigationState:
+    __slots__ = ('start_node', 'end_node', '_current_path', 'route_edge_set', 'path_type')
+
     def __init__(self):
         self.start_node = None
         self.end_node = None
         self.current_path = None
-        self.path_colors = {
-            "fastest": (0, 255, 0),      # Green
-            "accessible": (0, 150, 255),  # Light Blue
-            "selected": (255, 165, 0),    # Orange for selected nodes
-            "highlight": (255, 255, 0)    # Yellow for hovering
-        } 
\ No newline at end of file
+        self.path_type = "fastest"  # Route style: "fastest" or "accessible"
+
+    @property
+    def path_colors(self):
+        """Colors used when drawing navigation state; shared by every instance."""
+        return _PATH_COLORS
+
+    @property
+    def current_path(self):
+        return self._current_path
+
+    @current_path.setter
+    def current_path(self, path):
+        """Store the route and the set of its legs, in both directions, for O(1) highlight checks."""
+        self._current_path = path
+        nodes = path['nodes'] if path else ()
+        self.route_edge_set = frozenset(zip(nodes, nodes[1:])) | frozenset(zip(nodes[1:], nodes))
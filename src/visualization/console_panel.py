@@ -43,13 +43,52 @@ class ConsolePanel:
         # Dropdown menu properties
         self.dropdown_open = False  # Flag to check if the dropdown menu is open
         self.dropdown_rect = pygame.Rect(10, 280, 180, 30)  # Position of the dropdown menu
+        self._arrow_points = [  # Dropdown arrow, fixed by the dropdown's position
+            (self.dropdown_rect.right - 20, self.dropdown_rect.centery - 5),
+            (self.dropdown_rect.right - 10, self.dropdown_rect.centery + 5),
+            (self.dropdown_rect.right - 30, self.dropdown_rect.centery + 5)
+        ]
         self.algorithm_options = [  # List of algorithm options for selection
             "Dijkstra's Algorithm",
             "Breadth-First Search",
-            "Depth-First Search"
+            "Depth-First Search",
+            "A* Search"
         ]
         self.selected_algorithm = "Dijkstra's Algorithm"  # Default selected algorithm
         self.option_height = 30  # Height of each dropdown option
+        self._option_rects = [  # Area of each option below the dropdown, built once
+            pygame.Rect(
+                self.dropdown_rect.x,
+                self.dropdown_rect.y + (i + 1) * self.option_height,  # Position of each option
+                self.dropdown_rect.width,
+                self.option_height
+            )
+            for i in range(len(self.algorithm_options))
+        ]
+
+        self.accessibility_instructions = [  # Instructions specific to accessibility editing
+            "Accessibility Editing Mode:",
+            "",
+            "Click on paths to toggle",
+            "their accessibility status",
+            "",
+            "Yellow: Regular Path",
+            "Green: Accessible Path",
+            "",
+            "Ctrl+S: Save Map",
+            "Ctrl+L: Load Map",
+            "A: Exit Accessibility Editing"
+        ]
+
+        self._text_surfaces = {}  # (font, text, color) -> rendered text; every string shown is from a small fixed set
+        self._text(self.font, "CSUF Navigator", self.header_color)  # Pre-render the fixed strings so the first frames only blit
+        for line in self.edit_instructions + self.navigation_instructions + self.accessibility_instructions + self.algorithm_options:
+            self._text(self.small_font, line, self.text_color)
+        self._panel_surface = pygame.Surface((width + 2, height)).convert(screen)  # Cached panel, including the 2 px separator
+        self._panel_overflow = []  # (text, dest, area) blits() entries for lines running past the panel onto the map
+        self._panel_rect = pygame.Rect(0, 0, 0, 0)  # Area of the cache holding the last drawn panel
+        self._panel_cache_key = None  # _panel_key() the cache was drawn for
+        self._status_rect = pygame.Rect(10, 70 + 25 * len(self.navigation_instructions), 180, 25)  # Navigation accessibility status line
 
         self.accessibility_editing = False  # Flag for accessibility editing mode
         self.nav_accessibility = False  # Flag for navigation accessibility
@@ -61,102 +100,124 @@ class ConsolePanel:
             self.dropdown_open = not self.dropdown_open  # Toggle dropdown open state
         elif self.dropdown_open:  # If dropdown is open, check for option selection
             # Iterate through algorithm options to check for selection
-            for i, _ in enumerate(self.algorithm_options):
-                option_rect = pygame.Rect(
-                    self.dropdown_rect.x,
-                    self.dropdown_rect.y + (i + 1) * self.option_height,  # Position of each option
-                    self.dropdown_rect.width,
-                    self.option_height
-                )
+            for i, option_rect in enumerate(self._option_rects):
                 if option_rect.collidepoint(pos):  # Check if the click is on this option
                     self.selected_algorithm = self.algorithm_options[i]  # Update selected algorithm
                     self.dropdown_open = False  # Close the dropdown
                     return True  # Indicate that an option was selected
         return False  # No option was selected
 
-    def draw(self):
-        """Draw the console panel and its contents"""
+    def _text(self, font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+        """Rendered text surface, rasterized on first use and reused afterwards."""
+        key = (font, text, color)  # Everything the rendering depends on
+        surface = self._text_surfaces.get(key)
+        if surface is None:  # First time this string is shown
+            surface = self._text_surfaces[key] = font.render(text, True, color)  # Render once
+        return surface
+
+    def _panel_key(self) -> tuple:
+        """State that determines what the panel shows."""
+        return (getattr(self.map_editor, 'edit_mode', True), self.map_editor.is_accessible,
+                getattr(self.nav_handler, 'accessibility', None), self.selected_algorithm, self.dropdown_open)
+
+    def draw(self) -> pygame.Rect:
+        """Draw the console panel and its contents; returns the screen area it touched"""
+        key = self._panel_key()  # What the cached panel must show
+        old = self._panel_cache_key  # What the cache shows now
+        if key != old:  # Mode, selection or dropdown changed: repaint the cache
+            if old is not None and not key[0] and old[2] is not None and key[:2] + key[3:] == old[:2] + old[3:]:
+                # Only the navigation accessibility flag changed: repaint just its status line
+                self._panel_surface.set_clip(self._status_rect)
+                self._panel_surface.fill(self.bg_color)
+                self._draw_status(self._panel_surface)
+                self._panel_surface.set_clip(None)
+            else:
+                self._panel_rect = self._draw_panel(self._panel_surface)
+            self._panel_cache_key = key
+        self.screen.blit(self._panel_surface, self._panel_rect.topleft, self._panel_rect)  # One blit for the panel itself
+        if self._panel_overflow:  # Long lines blend over whatever map is underneath, in one batched call
+            self.screen.blits(self._panel_overflow, doreturn=0)
+        return self._panel_rect  # Same area the panel always covered
+
+    def _blit_text(self, surface: pygame.Surface, text: pygame.Surface, dest) -> pygame.Rect:
+        """Blit text onto the panel, noting any part that runs past it; returns the full text rect."""
+        rect = text.get_rect(topleft=dest) if isinstance(dest, tuple) else pygame.Rect(dest)  # Unclipped target area
+        surface.blit(text, rect)
+        edge = surface.get_width()  # First map column right of the separator
+        if rect.right > edge:  # Spills onto the map: keep the overhanging columns as a ready-made blits() entry
+            cut = edge - rect.x  # Text columns already in the cache
+            self._panel_overflow.append((text, (edge, rect.y), pygame.Rect(cut, 0, rect.width - cut, rect.height)))
+        return rect
+
+    def _draw_status(self, surface: pygame.Surface) -> pygame.Rect:
+        """Draw the navigation accessibility status line at _status_rect; returns the text rect"""
+        status_text = f"Accessibility Mode: {'ON' if self.nav_handler.accessibility else 'OFF'}"  # Status text based on accessibility
+        status = self._text(self.small_font, status_text,
+            (0, 150, 0) if self.nav_handler.accessibility else self.text_color)  # Green if accessibility is ON
+        return self._blit_text(surface, status, self._status_rect.topleft)
+
+    def _draw_panel(self, surface: pygame.Surface) -> pygame.Rect:
+        """Draw the console panel and its contents onto `surface`; returns the screen area it covers"""
+        self._panel_overflow = []  # Collected again by _blit_text
+        edit_mode = getattr(self.map_editor, 'edit_mode', True)  # Looked up once for the checks below
+        small_font, text_color = self.small_font, self.text_color  # Local bindings for the text loops
         # Draw console background
-        pygame.draw.rect(self.screen, self.bg_color, (0, 0, self.width, self.height))  # Draw background rectangle
-        pygame.draw.line(self.screen, (200, 200, 200), (self.width, 0), 
-                        (self.width, self.height), 2)  # Draw vertical line separating console from map
+        dirty = surface.fill(self.bg_color, (0, 0, self.width, self.height))  # Fill the background rectangle
+        dirty.union_ip(pygame.draw.line(surface, (200, 200, 200), (self.width, 0), 
+                        (self.width, self.height), 2))  # Draw vertical line separating console from map
 
         # Draw header
-        header = self.font.render("CSUF Navigator", True, self.header_color)  # Render header text
-        self.screen.blit(header, (10, 20))  # Blit header onto the screen
+        header = self._text(self.font, "CSUF Navigator", self.header_color)  # Pre-rendered header text
+        dirty.union_ip(self._blit_text(surface, header, (10, 20)))  # Blit header onto the panel
 
         # Check if in edit mode
-        if getattr(self.map_editor, 'edit_mode', True):
+        if edit_mode:
             # If in accessibility editing mode, show special instructions
             if self.map_editor.is_accessible:  # Check if accessibility editing is active
-                instructions = [  # Instructions specific to accessibility editing
-                    "Accessibility Editing Mode:",
-                    "",
-                    "Click on paths to toggle",
-                    "their accessibility status",
-                    "",
-                    "Yellow: Regular Path",
-                    "Green: Accessible Path",
-                    "",
-                    "Ctrl+S: Save Map",
-                    "Ctrl+L: Load Map",
-                    "A: Exit Accessibility Editing"
-                ]
+                instructions = self.accessibility_instructions  # Instructions specific to accessibility editing
                 y_offset = 70  # Initial vertical offset for drawing instructions
                 for line in instructions:  # Draw each instruction line
-                    text = self.small_font.render(line, True, self.text_color)  # Render instruction text
-                    self.screen.blit(text, (15, y_offset))  # Blit instruction text onto the screen
+                    text = self._text(small_font, line, text_color)  # Pre-rendered instruction text
+                    dirty.union_ip(self._blit_text(surface, text, (15, y_offset)))  # Blit instruction text onto the panel
                     y_offset += 25  # Increment vertical offset for next line
-                return  # Exit after drawing accessibility instructions
+                return dirty  # Exit after drawing accessibility instructions
 
         # Determine which set of instructions to display
-        current_instructions = self.edit_instructions if getattr(self.map_editor, 'edit_mode', True) else self.navigation_instructions
+        current_instructions = self.edit_instructions if edit_mode else self.navigation_instructions
 
         # Draw instructions
         y = 70  # Reset vertical position for drawing instructions
         for instruction in current_instructions:  # Iterate through current instructions
-            text = self.small_font.render(instruction, True, self.text_color)  # Render instruction text
-            self.screen.blit(text, (10, y))  # Blit instruction text onto the screen
+            text = self._text(small_font, instruction, text_color)  # Pre-rendered instruction text
+            dirty.union_ip(self._blit_text(surface, text, (10, y)))  # Blit instruction text onto the panel
             y += 25  # Increment vertical offset for next instruction
 
         # Draw accessibility status in navigation mode
-        if not getattr(self.map_editor, 'edit_mode', True) and hasattr(self.nav_handler, 'accessibility'):
-            status_text = f"Accessibility Mode: {'ON' if self.nav_handler.accessibility else 'OFF'}"  # Status text based on accessibility
-            status = self.small_font.render(status_text, True, 
-                (0, 150, 0) if self.nav_handler.accessibility else self.text_color)  # Green if accessibility is ON
-            self.screen.blit(status, (10, y))  # Blit accessibility status onto the screen
+        if not edit_mode and hasattr(self.nav_handler, 'accessibility'):
+            dirty.union_ip(self._draw_status(surface))  # Blit accessibility status onto the panel
             y += 25  # Increment vertical offset for next element
 
         # Draw algorithm selector dropdown in navigation mode
-        if not getattr(self.map_editor, 'edit_mode', True):
-            pygame.draw.rect(self.screen, (255, 255, 255), self.dropdown_rect)  # Draw dropdown background
-            pygame.draw.rect(self.screen, (100, 100, 100), self.dropdown_rect, 2)  # Draw dropdown border
+        if not edit_mode:
+            pygame.draw.rect(surface, (255, 255, 255), self.dropdown_rect)  # Draw dropdown background
+            pygame.draw.rect(surface, (100, 100, 100), self.dropdown_rect, 2)  # Draw dropdown border
             
             # Draw selected algorithm
-            text = self.small_font.render(self.selected_algorithm, True, self.text_color)  # Render selected algorithm text
+            text = self._text(self.small_font, self.selected_algorithm, self.text_color)  # Pre-rendered selected algorithm text
             text_rect = text.get_rect(midleft=(self.dropdown_rect.x + 5, self.dropdown_rect.centery))  # Position text in dropdown
-            self.screen.blit(text, text_rect)  # Blit selected algorithm text onto the screen
+            dirty.union_ip(self._blit_text(surface, text, text_rect))  # Blit selected algorithm text onto the panel
             
             # Draw dropdown arrow
-            arrow_points = [  # Define points for the dropdown arrow
-                (self.dropdown_rect.right - 20, self.dropdown_rect.centery - 5),
-                (self.dropdown_rect.right - 10, self.dropdown_rect.centery + 5),
-                (self.dropdown_rect.right - 30, self.dropdown_rect.centery + 5)
-            ]
-            pygame.draw.polygon(self.screen, self.text_color, arrow_points)  # Draw the dropdown arrow
+            pygame.draw.polygon(surface, text_color, self._arrow_points)  # Draw the dropdown arrow
             
             # Draw options if dropdown is open
             if self.dropdown_open:  # Check if the dropdown is open
-                for i, option in enumerate(self.algorithm_options):  # Iterate through algorithm options
-                    option_rect = pygame.Rect(
-                        self.dropdown_rect.x,
-                        self.dropdown_rect.y + (i + 1) * self.option_height,  # Position of each option
-                        self.dropdown_rect.width,
-                        self.option_height
-                    )
-                    pygame.draw.rect(self.screen, (255, 255, 255), option_rect)  # Draw option background
-                    pygame.draw.rect(self.screen, (100, 100, 100), option_rect, 1)  # Draw option border
+                for option, option_rect in zip(self.algorithm_options, self._option_rects):  # Iterate through algorithm options
+                    pygame.draw.rect(surface, (255, 255, 255), option_rect)  # Draw option background
+                    pygame.draw.rect(surface, (100, 100, 100), option_rect, 1)  # Draw option border
                     
-                    text = self.small_font.render(option, True, self.text_color)  # Render option text
+                    text = self._text(small_font, option, text_color)  # Pre-rendered option text
                     text_rect = text.get_rect(midleft=(option_rect.x + 5, option_rect.centery))  # Position text in option
-                    self.screen.blit(text, text_rect)  # Blit option text onto the screen
\ No newline at end of file
+                    dirty.union_ip(self._blit_text(surface, text, text_rect))  # Blit option text onto the panel
+
+        return dirty  # Union of everything drawn
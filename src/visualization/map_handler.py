@@ -1,7 +1,9 @@
 import pygame  # Import the pygame library for graphics and game development
 import pygame.font  # Import the font module from pygame for text rendering
-from typing import Tuple, Optional, List  # Import Tuple, Optional, and List for type hinting
-from core.graph_manager import GraphManager  # Import GraphManager for handling graph-related operations
+import numpy as np  # Import NumPy for vectorized coordinate transforms
+from typing import Dict, Tuple, Optional, List  # Import Dict, Tuple, Optional, and List for type hinting
+from algorithms.graph import GraphManager  # Import GraphManager for handling graph-related operations
+from data.spatial_index import SegmentGrid, UniformGrid  # Import grids for indexing path segments and nodes
 
 class MapHandler:
     """Handles the display and interaction with the campus map."""
@@ -18,7 +20,8 @@ class MapHandler:
         self.window_size = (self.console_width + self.map_width, self.window_height)
         self.map_rect = pygame.Rect(self.console_width, 0, self.map_width, self.window_height)  # Define the map area rectangle
         
-        self.screen = pygame.display.set_mode(self.window_size)  # Set the display mode with the defined window size
+        # Set the display mode; the flags only take effect where the backend supports them (pygame 1 fullscreen)
+        self.screen = pygame.display.set_mode(self.window_size, pygame.DOUBLEBUF | pygame.HWSURFACE)
         pygame.display.set_caption("CSUF Navigator")  # Set the window title
         
         # Load multiple background images (scale to map area, not full window)
@@ -54,11 +57,19 @@ class MapHandler:
         self.selected_node_radius = 10  # Radius for selected nodes
         
         self.path_click_threshold = 5  # Pixels distance for path click detection
+        self.path_index_cell = 32  # Pixel cell size of the path segment index; must be >= path_click_threshold
+        self._path_segments = []  # Path order -> (start_id, end_id, start_pos, end_pos)
+        self._path_grid = SegmentGrid(self.path_index_cell)  # Path order indices filed by screen cell
+        self._path_index_key = None  # (campus data, map version) the segment index was built for
+        self._node_pos_cache: Dict[str, Tuple[int, int]] = {}  # Location ID -> screen position
+        self._node_pos_key = None  # (campus data, map version) the positions were computed for
+        self._node_grid = UniformGrid(2 * self.node_radius)  # Node IDs filed by screen cell
+        self._node_index_key = None  # (campus data, map version) the node index was built for
     
     def _load_and_scale_image(self, path: str) -> pygame.Surface:
         """Load and scale an image to map area size (not full window)."""
         try:
-            img = pygame.image.load(path)  # Load the image from the specified path
+            img = pygame.image.load(path).convert()  # Load the image in the display's pixel format so blits copy rows directly
             return pygame.transform.scale(img, (self.map_width, self.window_height))  # Scale the image to fit the map area
         except (pygame.error, FileNotFoundError):  # Handle errors if the image cannot be loaded
             surface = pygame.Surface((self.map_width, self.window_height))  # Create a blank surface
@@ -128,24 +139,55 @@ class MapHandler:
         
         return (x, y)  # Return the normalized coordinates
     
-    def handle_click(self, pos: Tuple[int, int], graph_manager: GraphManager) -> Optional[str]:
+    def _node_positions(self, graph_manager: GraphManager, map_version: Optional[int] = None) -> Dict[str, Tuple[int, int]]:
+        """Screen position of every location, as drawn by draw_graph.
+
+        The table is reused while `map_version` is unchanged and recomputed on every call when it is None.
+        """
+        key = (id(graph_manager.campus_data), map_version)  # What the positions depend on
+        if map_version is None or key != self._node_pos_key:  # Nodes may have moved
+            campus_data = graph_manager.campus_data  # Current map data
+            ids = list(campus_data.locations)  # Location IDs
+            rows = np.fromiter((campus_data.loc_rows[loc_id] for loc_id in ids), np.intp, len(ids))  # Their coordinate rows
+            pixels = (campus_data.loc_xy[rows] * (self.map_width, self.window_height)).astype(np.intp)  # Truncate like int()
+            pixels += (self.console_width, 0)  # Map area starts right of the console
+            self._node_pos_cache = dict(zip(ids, map(tuple, pixels.tolist())))  # ID -> (x, y)
+            self._node_pos_key = key
+        return self._node_pos_cache
+
+    def invalidate_positions(self) -> None:
+        """Forget cached node positions and the node index, e.g. after nodes moved without a map version bump."""
+        self._node_pos_key = None
+        self._node_index_key = None
+
+    def _index_nodes(self, graph_manager: GraphManager, map_version: Optional[int]) -> None:
+        """Rebuild the screen-space node index unless it matches `map_version`."""
+        key = (id(graph_manager.campus_data), map_version)  # What the index depends on
+        if map_version is not None and key == self._node_index_key:  # Nodes unchanged since the last build
+            return
+        grid = UniformGrid(2 * self.node_radius)  # Cells wide enough for a node_radius query
+        for loc_id, (x, y) in self._node_positions(graph_manager, map_version).items():
+            grid.insert(loc_id, x, y)
+        self._node_grid = grid
+        self._node_index_key = key
+
+    def handle_click(self, pos: Tuple[int, int], graph_manager: GraphManager,
+                     map_version: Optional[int] = None) -> Optional[str]:
         """
         Handle mouse clicks for location selection.
         
         Args:
             pos: Mouse click position (x, y)
             graph_manager: GraphManager instance
+            map_version: Editor map version; the node index is reused while it is unchanged,
+                and rebuilt on every call when it is None
             
         Returns:
-            Location ID if a node was clicked, None otherwise
+            ID of the nearest node within node_radius of the click, None otherwise
         """
-        for loc_id, location in graph_manager.campus_data.locations.items():  # Iterate through all locations
-            node_pos = self._transform_coordinates(location.x, location.y)  # Transform location coordinates to screen coordinates
-            distance = ((pos[0] - node_pos[0]) ** 2 + (pos[1] - node_pos[1]) ** 2) ** 0.5  # Calculate the distance from the click position
-            
-            if distance <= self.node_radius:  # Check if the click is within the node radius
-                return loc_id  # Return the location ID if clicked
-        return None  # Return None if no node was clicked
+        self._index_nodes(graph_manager, map_version)  # Node index for the current positions
+        radius_sq = self.node_radius * self.node_radius  # Compare squared distances, no square root per node
+        return self._node_grid.query(pos, radius_sq + 1)  # Pixel distances are integers, so < r² + 1 means <= r²
     
     # def draw_debug_grid(self):
     #     """Draw coordinate grid and labels for debugging."""
@@ -168,26 +210,21 @@ class MapHandler:
     #             self.screen.blit(text, (x - 10, self.margin - 20))  # X-axis labels
     #             self.screen.blit(text, (self.margin - 30, y - 10))  # Y-axis labels
     
-    def draw_graph(self, graph_manager: GraphManager, current_path: Optional[List[str]] = None) -> None:
-        """Draw the graph with optional path highlighting"""
+    def draw_graph(self, graph_manager: GraphManager, current_path: Optional[List[str]] = None,
+                   map_version: Optional[int] = None) -> None:
+        """Draw the graph with optional path highlighting
+
+        Node screen positions are cached while `map_version` is unchanged (see _node_positions).
+        """
+        positions = self._node_positions(graph_manager, map_version)  # Cached screen positions
+        campus_data = graph_manager.campus_data  # Bind once for the loops
         # Draw all edges first
         for edge in graph_manager.get_edge_list():
-            start_loc = graph_manager.campus_data.locations[edge[0]]  # Get starting location for the edge
-            end_loc = graph_manager.campus_data.locations[edge[1]]  # Get ending location for the edge
-            
-            start_pos = (
-                int(start_loc.x * self.map_width) + self.console_width,  # Calculate starting position on the screen
-                int(start_loc.y * self.window_height)  # Calculate starting position on the screen
-            )
-            end_pos = (
-                int(end_loc.x * self.map_width) + self.console_width,  # Calculate ending position on the screen
-                int(end_loc.y * self.window_height)  # Calculate ending position on the screen
-            )
+            start_pos = positions[edge[0]]  # Starting position on the screen
+            end_pos = positions[edge[1]]  # Ending position on the screen
             
             # Get path object to check accessibility
-            path = next((p for p in graph_manager.campus_data.paths 
-                        if (p.start_id == edge[0] and p.end_id == edge[1]) or 
-                           (p.start_id == edge[1] and p.end_id == edge[0])), None)  # Find the path object
+            path = campus_data.neighbors(edge[0]).get(edge[1])  # O(1) lookup in either direction
             
             if path:
                 # Color based on accessibility
@@ -195,11 +232,8 @@ class MapHandler:
                 pygame.draw.line(self.screen, color, start_pos, end_pos, 2)  # Draw the edge with the determined color
         
         # Draw nodes last (on top of edges)
-        for loc_id, location in graph_manager.campus_data.locations.items():  # Iterate through all locations
-            pos = (
-                int(location.x * self.map_width) + self.console_width,  # Calculate position on the screen
-                int(location.y * self.window_height)  # Calculate position on the screen
-            )
+        for loc_id, location in campus_data.locations.items():  # Iterate through all locations
+            pos = positions[loc_id]  # Position on the screen
             
             if location.is_waypoint:
                 # Draw waypoints in yellow
@@ -220,47 +254,37 @@ class MapHandler:
             map_pos[1] / self.window_height  # Normalize y coordinate
         )
 
-    def draw_path(self, path: list, color: tuple = (255, 0, 0), width: int = 4):
-        """Draw the selected path with thicker lines"""
+    def draw_path(self, path: dict, color: tuple = (255, 0, 0), width: int = 4,
+                  graph_manager: Optional[GraphManager] = None, map_version: Optional[int] = None):
+        """Draw the selected path with thicker lines
+
+        Args:
+            path: Route dict with the node IDs under 'nodes'
+            color: Line color
+            width: Line width in pixels
+            graph_manager: GraphManager holding the locations; defaults to self.graph_manager
+            map_version: Editor map version for reusing cached node positions (see _node_positions)
+        """
         if not path:  # Check if the path is empty
             return  # Exit if no path to draw
-            
-        for i in range(len(path['nodes']) - 1):  # Iterate through nodes in the path
-            start_id = path['nodes'][i]  # Get starting node ID
-            end_id = path['nodes'][i + 1]  # Get ending node ID
-            
-            start_loc = self.graph_manager.campus_data.locations[start_id]  # Get starting location
-            end_loc = self.graph_manager.campus_data.locations[end_id]  # Get ending location
-            
-            start_pos = self._transform_coordinates(start_loc.x, start_loc.y)  # Transform starting location to screen coordinates
-            end_pos = self._transform_coordinates(end_loc.x, end_loc.y)  # Transform ending location to screen coordinates
-            
-            pygame.draw.line(self.screen, color, start_pos, end_pos, width)  # Draw the path segment
-
-    def get_clicked_path(self, click_pos: Tuple[int, int], graph_manager: GraphManager) -> Optional[Tuple[str, str]]:
-        """Detect if a path was clicked"""
-        def point_to_line_distance(point, line_start, line_end):
-            """Calculate distance from point to line segment"""
-            px, py = point  # Unpack point coordinates
-            x1, y1 = line_start  # Unpack line start coordinates
-            x2, y2 = line_end  # Unpack line end coordinates
-            
-            # Calculate the length of the line segment
-            line_length = ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
-            if line_length == 0:  # If the line length is zero
-                return ((px - x1) ** 2 + (py - y1) ** 2) ** 0.5  # Return distance to the start point
-            
-            # Calculate the distance from point to line
-            t = max(0, min(1, ((px - x1) * (x2 - x1) + (py - y1) * (y2 - y1)) / (line_length ** 2)))  # Project point onto line
-            proj_x = x1 + t * (x2 - x1)  # Calculate projected x coordinate
-            proj_y = y1 + t * (y2 - y1)  # Calculate projected y coordinate
-            return ((px - proj_x) ** 2 + (py - proj_y) ** 2) ** 0.5  # Return distance to the line
+        if graph_manager is None:
+            graph_manager = self.graph_manager  # Set by callers that predate the argument
+        positions = self._node_positions(graph_manager, map_version)  # Cached screen positions
+        points = [positions[node_id] for node_id in path['nodes']]  # Each node transformed once
+        if len(points) > 1:  # draw.lines needs at least two points
+            pygame.draw.lines(self.screen, color, False, points, width)  # Draw every segment in one call
 
-        # Check each path
-        for path in graph_manager.campus_data.paths:  # Iterate through all paths
-            start_loc = graph_manager.campus_data.locations[path.start_id]  # Get starting location for the path
-            end_loc = graph_manager.campus_data.locations[path.end_id]  # Get ending location for the path
-            
+    def _index_paths(self, graph_manager: GraphManager, map_version: Optional[int]) -> None:
+        """Rebuild the screen-space path segment index unless it matches `map_version`."""
+        key = (id(graph_manager.campus_data), map_version)  # What the index depends on
+        if map_version is not None and key == self._path_index_key:  # Geometry unchanged since the last build
+            return
+        locations = graph_manager.campus_data.locations  # Bind once for the loop
+        segments = []  # Path order -> endpoints and screen positions
+        grid = SegmentGrid(self.path_index_cell)  # Fresh index over the current paths
+        for i, path in enumerate(graph_manager.campus_data.paths):  # Iterate through all paths
+            start_loc = locations[path.start_id]  # Get starting location for the path
+            end_loc = locations[path.end_id]  # Get ending location for the path
             start_pos = (
                 int(start_loc.x * self.map_width) + self.console_width,  # Calculate starting position on the screen
                 int(start_loc.y * self.window_height)  # Calculate starting position on the screen
@@ -269,10 +293,55 @@ class MapHandler:
                 int(end_loc.x * self.map_width) + self.console_width,  # Calculate ending position on the screen
                 int(end_loc.y * self.window_height)  # Calculate ending position on the screen
             )
+            segments.append((path.start_id, path.end_id, start_pos, end_pos))
+            grid.insert(i, start_pos[0], start_pos[1], end_pos[0], end_pos[1])  # File under every cell it crosses
+        self._path_segments = segments
+        self._path_grid = grid
+        self._path_index_key = key
+
+    def get_clicked_path(self, click_pos: Tuple[int, int], graph_manager: GraphManager,
+                         map_version: Optional[int] = None) -> Optional[Tuple[str, str]]:
+        """Detect if a path was clicked
+
+        Args:
+            click_pos: Mouse click position (x, y)
+            graph_manager: GraphManager instance
+            map_version: Editor map version; the segment index is reused while it is unchanged,
+                and rebuilt on every call when it is None
+
+        Returns:
+            The IDs of the first path (in path order) within the click threshold, or None
+        """
+        def point_to_line_distance_sq(point, line_start, line_end):
+            """Calculate squared distance from point to line segment"""
+            px, py = point  # Unpack point coordinates
+            x1, y1 = line_start  # Unpack line start coordinates
+            x2, y2 = line_end  # Unpack line end coordinates
+            dx = x2 - x1  # Segment direction, computed once
+            dy = y2 - y1
+            
+            # Calculate the squared length of the line segment
+            length_sq = dx * dx + dy * dy
+            ox = px - x1  # Offset from the segment start
+            oy = py - y1
+            if length_sq == 0:  # If the line length is zero
+                return ox * ox + oy * oy  # Return squared distance to the start point
             
+            # Calculate the distance from point to line
+            t = max(0, min(1, (ox * dx + oy * dy) / length_sq))  # Project point onto line
+            ex = ox - t * dx  # Offset from the projected point
+            ey = oy - t * dy
+            return ex * ex + ey * ey  # Return squared distance to the line
+
+        threshold_sq = self.path_click_threshold * self.path_click_threshold  # Compare squared distances, no square roots per path
+        self._index_paths(graph_manager, map_version)  # Segment index for the current geometry
+        segments = self._path_segments
+        # Only paths crossing the cells around the click can be in reach; keep the lowest path order
+        for i in sorted(self._path_grid.candidates(click_pos)):
+            start_id, end_id, start_pos, end_pos = segments[i]
             # Check if click is near this path
-            distance = point_to_line_distance(click_pos, start_pos, end_pos)  # Calculate distance from click to path
-            if distance <= self.path_click_threshold:  # Check if distance is within threshold
-                return (path.start_id, path.end_id)  # Return the IDs of the clicked path
+            distance_sq = point_to_line_distance_sq(click_pos, start_pos, end_pos)  # Calculate squared distance from click to path
+            if distance_sq <= threshold_sq:  # Check if distance is within threshold
+                return (start_id, end_id)  # Return the IDs of the clicked path
         
         return None  # Return None if no path was clicked
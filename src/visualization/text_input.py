@@ -23,6 +23,9 @@ class TextInput:
         # Label for the input box
         self.label = "Enter Building Name:"  # Text label for the input box
         self.label_color = (50, 50, 50)  # Color of the label text
+        self._label_surface = self.font.render(self.label, True, self.label_color)  # The label never changes
+        self._overlay = None  # Dimming overlay, built on first draw
+        self._text_cache = (None, None)  # (text, rendered surface) of the last drawn entry text
 
     def activate(self, position: Tuple[int, int]):
         """Activate text input at given position."""
@@ -53,8 +56,9 @@ class TextInput:
                 return None  # Return None to indicate cancellation
             else:
                 # Only add printable characters to the text
-                if event.unicode.isprintable():  # Check if the character is printable
-                    self.text += event.unicode  # Append the character to the text
+                char = event.unicode  # Typed text for the key
+                if (len(char) == 1 and ' ' <= char <= '~') or char.isprintable():  # Printable ASCII first, Unicode check otherwise
+                    self.text += char  # Append the character to the text
         return None  # Return None if no relevant event occurred
 
     def draw(self):
@@ -63,9 +67,10 @@ class TextInput:
             return
 
         # Draw a semi-transparent overlay to focus on the input box
-        overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)  # Create an overlay surface
-        pygame.draw.rect(overlay, (0, 0, 0, 128), overlay.get_rect())  # Draw a semi-transparent rectangle
-        self.screen.blit(overlay, (0, 0))  # Blit the overlay onto the screen
+        if self._overlay is None or self._overlay.get_size() != self.screen.get_size():  # First draw
+            self._overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA).convert_alpha()  # Create an overlay surface
+            self._overlay.fill((0, 0, 0, 128))  # Semi-transparent black
+        self.screen.blit(self._overlay, (0, 0))  # Blit the overlay onto the screen
 
         # Draw the input box background
         input_rect = pygame.Rect(
@@ -78,7 +83,7 @@ class TextInput:
         pygame.draw.rect(self.screen, self.border_color, input_rect, 2)  # Draw the border
 
         # Draw the label above the input box
-        label_surface = self.font.render(self.label, True, self.label_color)  # Render the label text
+        label_surface = self._label_surface  # Pre-rendered label text
         label_pos = (
             self.position[0],  # X position of the label
             self.position[1] - 30  # Y position of the label, above the input box
@@ -86,7 +91,9 @@ class TextInput:
         self.screen.blit(label_surface, label_pos)  # Blit the label onto the screen
 
         # Draw the current text inside the input box
-        text_surface = self.font.render(self.text, True, self.text_color)  # Render the current text
+        if self._text_cache[0] != self.text:  # Text changed since the last frame: render it once
+            self._text_cache = (self.text, self.font.render(self.text, True, self.text_color).convert_alpha())
+        text_surface = self._text_cache[1]  # Current text, rendered
         text_pos = (
             self.position[0] + self.padding,  # X position with padding
             self.position[1] + (self.height - text_surface.get_height()) // 2  # Center vertically
@@ -1,33 +1,42 @@
 import json
 from pathlib import Path
 
-def calculate_distance(start_pos, end_pos, scale_factor=750):
-    """Calculate the Euclidean distance between two points"""
-    dx = (end_pos['x'] - start_pos['x']) * scale_factor
-    dy = (end_pos['y'] - start_pos['y']) * scale_factor
-    return round(((dx ** 2 + dy ** 2) ** 0.5), 1)
+import numpy as np
+
+try:
+    import orjson  # Optional faster JSON serializer
+except ImportError:
+    orjson = None  # Fall back to the standard library json module
+
+SCALE_FACTOR = 750  # Meters per unit of normalized map coordinates
 
 def update_distances():
     # Load the existing JSON file
     json_path = Path('data/locations.json')
-    with open(json_path, 'r') as f:
-        data = json.load(f)
+    raw = json_path.read_bytes()
+    data = orjson.loads(raw) if orjson else json.loads(raw)
+    
+    # Coordinates as arrays, indexed by position in the locations list
+    index = {loc['id']: i for i, loc in enumerate(data['locations'])}
+    xy = np.array([(loc['x'], loc['y']) for loc in data['locations']], dtype=np.float64).reshape(-1, 2)
     
-    # Create a lookup for locations
-    locations = {loc['id']: loc for loc in data['locations']}
+    # Endpoint rows of every path
+    paths = data['paths']
+    start_rows = np.fromiter((index[path['start_id']] for path in paths), np.intp, len(paths))
+    end_rows = np.fromiter((index[path['end_id']] for path in paths), np.intp, len(paths))
     
-    # Update distances in paths
-    for path in data['paths']:
-        start_loc = locations[path['start_id']]
-        end_loc = locations[path['end_id']]
-        
-        # Calculate new distance
-        distance = calculate_distance(start_loc, end_loc)
+    # Calculate all distances in one pass: scaled Euclidean length, rounded to 0.1 m
+    delta = (xy[end_rows] - xy[start_rows]) * SCALE_FACTOR
+    distances = np.round(np.hypot(delta[:, 0], delta[:, 1]), 1)
+    for path, distance in zip(paths, distances.tolist()):
         path['distance'] = distance
     
-    # Save the updated JSON file
-    with open(json_path, 'w') as f:
-        json.dump(data, f, indent=4)
+    # Save the updated JSON file (orjson only offers two-space indentation)
+    if orjson:
+        json_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(json_path, 'w') as f:
+            json.dump(data, f, indent=4)
     
     print("Distances updated successfully!")
 